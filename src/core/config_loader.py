@@ -92,6 +92,9 @@ class SemanticConfig:
     max_chunk_chars: int
     chunk_overlap_chars: int
     embedding_batch_size: int
+    max_parallel_requests: int
+    query_cache_size: int
+    query_cache_ttl_seconds: float
 
 
 @dataclass
@@ -224,7 +227,10 @@ class Config:
             embedding_dimensions=semantic_data.get("embedding_dimensions", 1024),
             max_chunk_chars=semantic_data.get("max_chunk_chars", 1800),
             chunk_overlap_chars=semantic_data.get("chunk_overlap_chars", 200),
-            embedding_batch_size=semantic_data.get("embedding_batch_size", 32)
+            embedding_batch_size=semantic_data.get("embedding_batch_size", 32),
+            max_parallel_requests=semantic_data.get("max_parallel_requests", 4),
+            query_cache_size=semantic_data.get("query_cache_size", 0),
+            query_cache_ttl_seconds=semantic_data.get("query_cache_ttl_seconds", 300)
         )
 
         hybrid_data = data.get("hybrid", {})
@@ -6,7 +6,7 @@ for the document index. Includes vector storage for semantic search.
 """
 
 from .connection import get_connection, get_cursor, DatabaseManager
-from .schema import init_schema, reset_schema, get_statistics, init_vector_index, is_vec_extension_available, reset_vec_extension_cache
+from .schema import init_schema, reset_schema, optimize_fts_index, get_statistics, init_vector_index, is_vec_extension_available, reset_vec_extension_cache
 from .repository import DocumentRepository
 from .vector_repository import VectorRepository, VectorSearchResult
 
@@ -16,6 +16,7 @@ __all__ = [
     "DatabaseManager",
     "init_schema",
     "reset_schema",
+    "optimize_fts_index",
     "get_statistics",
     "init_vector_index",
     "is_vec_extension_available",
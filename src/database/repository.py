@@ -57,7 +57,7 @@ class DocumentRepository:
             page_num: Page number (1-indexed).
             content: Extracted text content.
             relative_path: Path relative to data directory.
-            file_hash: MD5 hash for change detection.
+            file_hash: SHA-256 hash for change detection.
 
         Returns:
             Inserted row ID or None if duplicate.
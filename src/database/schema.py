@@ -94,6 +94,24 @@ DOCUMENTS_INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_documents_hash ON documents(file_hash)"
 ]
 
+# Single-row running totals over documents, kept current by triggers so
+# page counts and content size are read in O(1) instead of a table scan.
+# version is bumped on every write so caches can detect any change.
+DOCUMENTS_STATS_TABLE = """
+CREATE TABLE IF NOT EXISTS documents_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    n INTEGER NOT NULL DEFAULT 0,
+    sum_len INTEGER NOT NULL DEFAULT 0,
+    version INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+# Seeds from existing rows so databases created before the table stay exact
+DOCUMENTS_STATS_SEED = """
+INSERT OR IGNORE INTO documents_stats (id, n, sum_len, version)
+SELECT 1, COUNT(*), COALESCE(SUM(LENGTH(content)), 0), 0 FROM documents
+"""
+
 CHUNKS_METADATA_TABLE = """
 CREATE TABLE IF NOT EXISTS chunks_metadata (
     chunk_id TEXT PRIMARY KEY,
@@ -161,6 +179,51 @@ FTS_TRIGGERS = [
     """
 ]
 
+STATS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS documents_stats_ai AFTER INSERT ON documents BEGIN
+        UPDATE documents_stats
+        SET n = n + 1,
+            sum_len = sum_len + COALESCE(LENGTH(new.content), 0),
+            version = version + 1
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS documents_stats_ad AFTER DELETE ON documents BEGIN
+        UPDATE documents_stats
+        SET n = n - 1,
+            sum_len = sum_len - COALESCE(LENGTH(old.content), 0),
+            version = version + 1
+        WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS documents_stats_au AFTER UPDATE ON documents BEGIN
+        UPDATE documents_stats
+        SET sum_len = sum_len
+                - COALESCE(LENGTH(old.content), 0)
+                + COALESCE(LENGTH(new.content), 0),
+            version = version + 1
+        WHERE id = 1;
+    END
+    """
+]
+
+# Chunk writes bump the same version so semantic caches see reindexing too
+CHUNKS_VERSION_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS chunks_version_ai AFTER INSERT ON chunks_metadata BEGIN
+        UPDATE documents_stats SET version = version + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS chunks_version_ad AFTER DELETE ON chunks_metadata BEGIN
+        UPDATE documents_stats SET version = version + 1 WHERE id = 1;
+    END
+    """
+]
+
 
 def init_schema() -> None:
     """
@@ -183,7 +246,10 @@ def init_schema() -> None:
             if "already exists" not in str(e):
                 raise DatabaseError(f"Failed to create FTS table: {e}")
 
-        for trigger_sql in FTS_TRIGGERS:
+        cur.execute(DOCUMENTS_STATS_TABLE)
+        cur.execute(DOCUMENTS_STATS_SEED)
+
+        for trigger_sql in FTS_TRIGGERS + STATS_TRIGGERS:
             try:
                 cur.execute(trigger_sql)
             except sqlite3.OperationalError as e:
@@ -196,6 +262,9 @@ def init_schema() -> None:
         for index_sql in CHUNKS_INDEXES:
             cur.execute(index_sql)
 
+        for trigger_sql in CHUNKS_VERSION_TRIGGERS:
+            cur.execute(trigger_sql)
+
     logger.info("Schema initialization complete")
 
 
@@ -239,6 +308,20 @@ def init_vector_index(dimensions: int = None) -> bool:
     return True
 
 
+def optimize_fts_index() -> None:
+    """
+    Merge the FTS5 index into a single b-tree segment.
+
+    Each batch insert adds a new segment, and BM25 queries must read and
+    merge the posting lists of every segment. Running this after a bulk
+    indexing pass lets each term's postings come from one segment.
+    """
+    logger.info("Optimizing FTS5 index")
+
+    with get_cursor() as cur:
+        cur.execute("INSERT INTO documents_fts(documents_fts) VALUES('optimize')")
+
+
 def reset_schema() -> None:
     """
     Drop and recreate all tables.
@@ -251,6 +334,12 @@ def reset_schema() -> None:
         cur.execute("DROP TRIGGER IF EXISTS documents_ai")
         cur.execute("DROP TRIGGER IF EXISTS documents_ad")
         cur.execute("DROP TRIGGER IF EXISTS documents_au")
+        cur.execute("DROP TRIGGER IF EXISTS documents_stats_ai")
+        cur.execute("DROP TRIGGER IF EXISTS documents_stats_ad")
+        cur.execute("DROP TRIGGER IF EXISTS documents_stats_au")
+        cur.execute("DROP TRIGGER IF EXISTS chunks_version_ai")
+        cur.execute("DROP TRIGGER IF EXISTS chunks_version_ad")
+        cur.execute("DROP TABLE IF EXISTS documents_stats")
         cur.execute("DROP TABLE IF EXISTS documents_fts")
         cur.execute("DROP TABLE IF EXISTS chunks_vec_idx")
         cur.execute("DROP TABLE IF EXISTS chunks_vec")
@@ -272,18 +361,17 @@ def get_statistics() -> dict:
     with get_connection() as conn:
         stats = {}
 
-        row = conn.execute("SELECT COUNT(*) as count FROM documents").fetchone()
-        stats["total_pages"] = row["count"]
+        row = conn.execute(
+            "SELECT n, sum_len FROM documents_stats WHERE id = 1"
+        ).fetchone()
+        stats["total_pages"] = row["n"]
+        total_bytes = row["sum_len"]
 
         row = conn.execute(
             "SELECT COUNT(DISTINCT filepath) as count FROM documents"
         ).fetchone()
         stats["total_files"] = row["count"]
 
-        row = conn.execute(
-            "SELECT SUM(LENGTH(content)) as total FROM documents"
-        ).fetchone()
-        total_bytes = row["total"] or 0
         stats["total_content_mb"] = round(total_bytes / (1024 * 1024), 2)
 
         row = conn.execute(
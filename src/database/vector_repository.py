@@ -4,7 +4,6 @@ Vector repository for storing and querying embeddings.
 Provides storage and k-nearest-neighbor search using sqlite-vec extension.
 """
 
-import struct
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -18,6 +17,36 @@ from .schema import _load_vec_extension
 logger = get_logger(__name__)
 
 
+def normalize_rows(arr: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize a vector or each row of a matrix as contiguous float32.
+
+    On unit vectors, L2 nearest-neighbor order equals cosine order and
+    cosine similarity reduces to a plain dot product.
+    Zero vectors are left unchanged.
+
+    Args:
+        arr: Vector of shape (d,) or matrix of shape (n, d).
+
+    Returns:
+        Normalized float32 array with the same shape.
+    """
+    arr = np.array(arr, dtype=np.float32, order="C")
+
+    # Squared norms as dot products: no abs/square temporaries as in
+    # np.linalg.norm, and a single BLAS call for the query vector
+    if arr.ndim == 1:
+        norm = float(np.sqrt(np.dot(arr, arr)))
+        if norm:
+            arr /= norm
+        return arr
+
+    norms = np.sqrt(np.einsum("...i,...i->...", arr, arr))[..., np.newaxis]
+    norms[norms == 0] = 1.0
+    arr /= norms
+    return arr
+
+
 @dataclass
 class VectorSearchResult:
     """
@@ -80,7 +109,7 @@ class VectorRepository:
             chunk: SemanticChunk object with metadata.
             embedding: numpy array of embedding vector.
         """
-        embedding_blob = self._array_to_blob(embedding)
+        embedding_blob = self._array_to_blob(normalize_rows(embedding))
 
         with get_cursor() as cur:
             cur.execute("""
@@ -132,22 +161,26 @@ class VectorRepository:
         if not chunks or len(embeddings) == 0:
             return 0
 
-        metadata_rows = []
-        vec_rows = []
-
-        for chunk, embedding in zip(chunks, embeddings):
-            embedding_blob = self._array_to_blob(embedding)
+        # One contiguous, L2-normalized float32 matrix; each row's bytes are
+        # taken directly from it instead of re-packing element by element.
+        matrix = normalize_rows(embeddings)
 
-            metadata_rows.append((
+        metadata_rows = [
+            (
                 chunk.chunk_id,
                 chunk.document_id,
                 chunk.page_num,
                 chunk.position,
                 chunk.content,
                 chunk.char_count
-            ))
+            )
+            for chunk in chunks
+        ]
 
-            vec_rows.append((chunk.chunk_id, embedding_blob))
+        vec_rows = [
+            (chunk.chunk_id, row.tobytes())
+            for chunk, row in zip(chunks, matrix)
+        ]
 
         with get_cursor() as cur:
             cur.executemany("""
@@ -164,15 +197,14 @@ class VectorRepository:
 
         with get_connection() as conn:
             if self._ensure_vec_extension(conn):
-                for chunk_id, embedding_blob in vec_rows:
-                    conn.execute(
-                        "DELETE FROM chunks_vec_idx WHERE chunk_id = ?",
-                        (chunk_id,)
-                    )
-                    conn.execute("""
-                        INSERT INTO chunks_vec_idx (chunk_id, embedding)
-                        VALUES (?, ?)
-                    """, (chunk_id, embedding_blob))
+                conn.executemany(
+                    "DELETE FROM chunks_vec_idx WHERE chunk_id = ?",
+                    ((chunk_id,) for chunk_id, _ in vec_rows)
+                )
+                conn.executemany("""
+                    INSERT INTO chunks_vec_idx (chunk_id, embedding)
+                    VALUES (?, ?)
+                """, vec_rows)
                 conn.commit()
 
         logger.debug(f"Stored {len(chunks)} chunks with embeddings")
@@ -181,7 +213,8 @@ class VectorRepository:
     def search_similar(
         self,
         query_embedding: np.ndarray,
-        limit: int = 10
+        limit: int = 10,
+        normalized: bool = False
     ) -> List[VectorSearchResult]:
         """
         Search for similar chunks using vector similarity.
@@ -189,10 +222,14 @@ class VectorRepository:
         Args:
             query_embedding: Query vector as numpy array.
             limit: Maximum number of results.
+            normalized: Whether query_embedding is already unit length,
+                in which case it is not normalized again.
 
         Returns:
             List of VectorSearchResult ordered by similarity (descending).
         """
+        if not normalized:
+            query_embedding = normalize_rows(query_embedding)
         query_blob = self._array_to_blob(query_embedding)
 
         with get_connection() as conn:
@@ -341,9 +378,9 @@ class VectorRepository:
             arr: numpy array of floats.
 
         Returns:
-            Packed bytes representation.
+            Packed native-order float32 bytes, as sqlite-vec reads them.
         """
-        return struct.pack(f"{len(arr)}f", *arr.astype(np.float32))
+        return np.ascontiguousarray(arr, dtype=np.float32).tobytes()
 
     def _blob_to_array(self, blob: bytes) -> np.ndarray:
         """
@@ -355,8 +392,7 @@ class VectorRepository:
         Returns:
             numpy array of floats.
         """
-        count = len(blob) // 4
-        return np.array(struct.unpack(f"{count}f", blob))
+        return np.frombuffer(blob, dtype=np.float32)
 
 
 if __name__ == "__main__":
@@ -106,6 +106,17 @@ def main():
     render_pdf_from_state()
 
 
+@st.cache_resource
+def _get_engine() -> HybridEngine:
+    """
+    Get the search engine shared by all reruns and sessions.
+
+    Keeping one engine alive lets its query and count caches carry over
+    between searches instead of starting empty on every rerun.
+    """
+    return HybridEngine()
+
+
 def _execute_search(query_text: str, options: dict) -> None:
     """
     Execute search and store results in state.
@@ -114,7 +125,7 @@ def _execute_search(query_text: str, options: dict) -> None:
         query_text: The search query string.
         options: Search options from sidebar.
     """
-    engine = HybridEngine()
+    engine = _get_engine()
 
     mode_str = options.get("search_mode", "hybrid")
     mode = SearchMode(mode_str)
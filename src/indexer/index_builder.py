@@ -6,12 +6,13 @@ extracting text, and storing in the database with progress tracking.
 Includes optional semantic indexing for vector search.
 """
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from ..core import get_config, get_logger, ExtractionError
-from ..database import init_schema, reset_schema, DocumentRepository, get_connection
+from ..database import init_schema, reset_schema, optimize_fts_index, DocumentRepository, get_connection
 from ..extraction import FileScanner, PDFExtractor
 from ..utils import get_file_hash, get_relative_path, clean_text
 
@@ -76,6 +77,9 @@ class IndexBuilder:
         self.semantic_indexer = None
         self._pending_semantic: List[Dict] = []
 
+        # Data directory with symlinks resolved, refreshed at the start of each run
+        self._data_root: Optional[str] = None
+
     def build(self) -> IndexingStats:
         """
         Run the complete indexing pipeline.
@@ -92,6 +96,8 @@ class IndexBuilder:
         else:
             init_schema()
 
+        self._resolve_data_root()
+
         if self.semantic_enabled:
             self._init_semantic_indexer()
 
@@ -153,6 +159,9 @@ class IndexBuilder:
         if batch:
             self._commit_batch(batch)
 
+        if stats.pages_indexed > 0:
+            optimize_fts_index()
+
         logger.info(
             f"FTS5 indexing complete: {stats.files_indexed} files indexed, "
             f"{stats.pages_indexed} pages, {stats.files_failed} failures"
@@ -207,6 +216,10 @@ class IndexBuilder:
             f"{stats.semantic_errors} errors"
         )
 
+    def _resolve_data_root(self) -> None:
+        """Resolve the data directory once for all files of this run."""
+        self._data_root = os.path.realpath(self.config.paths.data_directory)
+
     def _get_doc_id_for_filepath(self, filepath: str) -> Optional[int]:
         """Get the document ID for a filepath from the database."""
         with get_connection() as conn:
@@ -255,7 +268,7 @@ class IndexBuilder:
             return 0, []
 
         file_hash = get_file_hash(filepath)
-        relative_path = get_relative_path(filepath, self.config.paths.data_directory)
+        relative_path = get_relative_path(filepath, self._data_root, base_resolved=True)
         filename = filepath.name
 
         pages_data: List[Tuple[int, str]] = []
@@ -309,6 +322,7 @@ class IndexBuilder:
             Number of pages indexed.
         """
         init_schema()
+        self._resolve_data_root()
 
         batch: List[tuple] = []
         pages_added = self._process_file(filepath, batch)
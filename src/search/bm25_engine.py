@@ -5,7 +5,10 @@ Executes full-text searches with BM25 ranking, generates snippets
 with highlighted matches, and handles pagination.
 """
 
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
 from typing import List, Optional, Tuple
 
 from ..core import get_config, get_logger, SearchError
@@ -15,6 +18,9 @@ from .query_parser import QueryParser
 
 logger = get_logger(__name__)
 
+# Parsed queries whose pagination count is kept by each engine
+COUNT_CACHE_SIZE = 1024
+
 
 class BM25Engine:
     """
@@ -35,6 +41,20 @@ class BM25Engine:
         self.default_limit = self.config.search.default_limit
         self.max_limit = self.config.search.max_limit
 
+        # Ranking SQL is fixed per engine; build both variants once
+        self._search_sql = {
+            include_content: self._build_search_sql(include_content)
+            for include_content in (False, True)
+        }
+
+        # Pagination counts per parsed query, valid while the corpus is unchanged
+        self._count_cache: "OrderedDict[str, int]" = OrderedDict()
+        self.count_cache_size = COUNT_CACHE_SIZE
+        self._corpus_token: Optional[int] = None
+
+        # One engine may serve several GUI sessions at once
+        self._cache_lock = threading.Lock()
+
     def search(
         self,
         query: SearchQuery,
@@ -53,31 +73,90 @@ class BM25Engine:
         Raises:
             SearchError: If query execution fails.
         """
-        start_time = time.time()
+        return self.search_batch([query], include_content)[0]
 
+    def search_batch(
+        self,
+        queries: List[SearchQuery],
+        include_content: bool = False
+    ) -> List[Tuple[List[SearchResult], SearchStats]]:
+        """
+        Execute several full-text searches over a single connection.
+
+        All queries are parsed up front, then run against one shared
+        connection so repeated statements reuse SQLite's prepared
+        statement cache instead of being prepared on a fresh connection.
+
+        Args:
+            queries: SearchQuery objects to execute.
+            include_content: Whether to include full page content in results.
+
+        Returns:
+            List of (list of SearchResult, SearchStats) tuples, in input order.
+
+        Raises:
+            SearchError: If any query execution fails.
+        """
+        parsed_queries = [self._parse_query(query) for query in queries]
+
+        if not any(parsed_queries):
+            return [self._empty_search(query) for query in queries]
+
+        try:
+            with get_connection() as conn:
+                corpus_token = self._check_corpus_token(conn)
+                return [
+                    self._run_search(
+                        conn, query, parsed_query, include_content, corpus_token
+                    )
+                    if parsed_query else self._empty_search(query)
+                    for query, parsed_query in zip(queries, parsed_queries)
+                ]
+        except SearchError:
+            raise
+        except Exception as e:
+            logger.error(f"Search failed: {e}")
+            raise SearchError(f"Search execution failed: {e}")
+
+    def _parse_query(self, query: SearchQuery) -> str:
+        """Parse query text according to its basic/advanced mode."""
         if query.advanced:
-            parsed_query = self.parser.parse_advanced(query.text)
-        else:
-            parsed_query = self.parser.parse(query.text)
-
-        if not parsed_query:
-            return [], SearchStats(
-                query=query.text,
-                total_results=0,
-                execution_time_ms=0
-            )
+            return self.parser.parse_advanced(query.text)
+        return self.parser.parse(query.text)
+
+    @staticmethod
+    def _empty_search(query: SearchQuery) -> Tuple[List[SearchResult], SearchStats]:
+        """Build the result for a query with no searchable terms."""
+        return [], SearchStats(
+            query=query.text,
+            total_results=0,
+            execution_time_ms=0
+        )
+
+    def _run_search(
+        self,
+        conn: sqlite3.Connection,
+        query: SearchQuery,
+        parsed_query: str,
+        include_content: bool,
+        corpus_token: Optional[int]
+    ) -> Tuple[List[SearchResult], SearchStats]:
+        """Execute a parsed query on an open connection and build its stats."""
+        start_time = time.time()
 
         limit = min(query.limit or self.default_limit, self.max_limit)
 
         try:
+            # Ranking and counting both run inside FTS5 on the same connection
             results = self._execute_search(
+                conn,
                 parsed_query,
                 limit,
                 query.offset,
                 include_content
             )
 
-            total_count = self._count_results(parsed_query)
+            total_count = self._count_results(conn, parsed_query, corpus_token)
 
         except Exception as e:
             logger.error(f"Search failed: {e}")
@@ -107,16 +186,44 @@ class BM25Engine:
 
     def _execute_search(
         self,
+        conn: sqlite3.Connection,
         query: str,
         limit: int,
         offset: int,
         include_content: bool
     ) -> List[SearchResult]:
-        """Execute the FTS5 search query."""
+        """
+        Execute the FTS5 search query.
+
+        bm25() scoring, ORDER BY and LIMIT all run inside SQLite, so only
+        the requested page of rows is materialized in Python.
+        """
+        sql = self._search_sql[include_content]
+
+        rows = conn.execute(sql, (query, limit, offset)).fetchall()
+
+        results = []
+        for row in rows:
+            result = SearchResult(
+                id=row["id"],
+                filepath=row["filepath"],
+                filename=row["filename"],
+                page_num=row["page_num"],
+                relative_path=row["relative_path"],
+                snippet=row["snippet"] or "",
+                score=row["score"],
+                content=row["content"] if include_content else None
+            )
+            results.append(result)
+
+        return results
+
+    def _build_search_sql(self, include_content: bool) -> str:
+        """Build the ranked FTS5 search statement."""
         content_select = ", d.content" if include_content else ""
 
         # BM25 weights: first param is filename, second is content
-        sql = f"""
+        return f"""
             SELECT
                 d.id,
                 d.filepath,
@@ -133,36 +240,64 @@ class BM25Engine:
             LIMIT ? OFFSET ?
         """
 
-        with get_connection() as conn:
-            rows = conn.execute(sql, (query, limit, offset)).fetchall()
+    def _check_corpus_token(self, conn: sqlite3.Connection) -> Optional[int]:
+        """
+        Drop cached counts if the documents table changed.
 
-        results = []
-        for row in rows:
-            result = SearchResult(
-                id=row["id"],
-                filepath=row["filepath"],
-                filename=row["filename"],
-                page_num=row["page_num"],
-                relative_path=row["relative_path"],
-                snippet=row["snippet"] or "",
-                score=row["score"],
-                content=row["content"] if include_content else None
-            )
-            results.append(result)
+        The version counter in documents_stats is bumped by triggers on
+        every insert, update and delete, so the check is a single-row read.
 
-        return results
+        Returns:
+            The version read, to tag counts computed on this connection,
+            or None if the stats row is missing.
+        """
+        row = conn.execute(
+            "SELECT version FROM documents_stats WHERE id = 1"
+        ).fetchone()
+        # A missing stats row leaves the version unknown; nothing is cached
+        token = row["version"] if row is not None else None
+
+        with self._cache_lock:
+            if token is None or token != self._corpus_token:
+                self._count_cache.clear()
+                self._corpus_token = token
+
+        return token
+
+    def _count_results(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        corpus_token: Optional[int]
+    ) -> int:
+        """
+        Count total matching documents for pagination (cached per query).
+
+        A count is only stored if the corpus version it was read under is
+        still current, so a search racing an index change cannot cache a
+        stale total. The least recently used count is evicted first.
+        """
+        with self._cache_lock:
+            cached = self._count_cache.get(query)
+            if cached is not None:
+                self._count_cache.move_to_end(query)
+                return cached
 
-    def _count_results(self, query: str) -> int:
-        """Count total matching documents for pagination."""
         sql = """
             SELECT COUNT(*) as count
             FROM documents_fts
             WHERE documents_fts MATCH ?
         """
 
-        with get_connection() as conn:
-            row = conn.execute(sql, (query,)).fetchone()
-            return row["count"]
+        count = conn.execute(sql, (query,)).fetchone()["count"]
+
+        with self._cache_lock:
+            if corpus_token is not None and corpus_token == self._corpus_token:
+                self._count_cache[query] = count
+                while len(self._count_cache) > self.count_cache_size:
+                    self._count_cache.popitem(last=False)
+
+        return count
 
     def search_simple(
         self,
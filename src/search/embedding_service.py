@@ -9,7 +9,9 @@ Includes resilience features:
 - Auto-split chunks that exceed token limits
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 
 import numpy as np
@@ -20,12 +22,43 @@ from ..core import get_config, get_logger
 logger = get_logger(__name__)
 
 _embedding_service: Optional["EmbeddingService"] = None
+_embedding_service_lock = threading.Lock()
 
 # Retry configuration for server errors (500)
 RETRY_DELAY = 60  # Base delay between retries (seconds)
 MAX_RETRY_DELAY = 300  # Max delay (5 minutes)
 STATUS_LOG_INTERVAL = 5  # Log status every N retries
 
+# Element type of every array returned by the service
+EMBEDDING_DTYPE = np.float32
+
+# E5 input prefixes for documents and queries
+PASSAGE_PREFIX = "passage: "
+QUERY_PREFIX = "query: "
+
+
+class _BatchCancelled(Exception):
+    """Raised inside a worker when its batch set has been cancelled."""
+
+
+def _raise_if_cancelled(cancel: Optional[threading.Event]) -> None:
+    """Abandon the current batch if the caller has cancelled the run."""
+    if cancel is not None and cancel.is_set():
+        raise _BatchCancelled()
+
+
+def _wait_before_retry(delay: float, cancel: Optional[threading.Event]) -> None:
+    """
+    Sleep before retrying a request.
+
+    With a cancellation event the wait ends as soon as it is set, so
+    retry loops on worker threads do not outlive a failed or interrupted run.
+    """
+    if cancel is None:
+        time.sleep(delay)
+    elif cancel.wait(delay):
+        raise _BatchCancelled()
+
 
 class EmbeddingService:
     """
@@ -67,17 +100,20 @@ class EmbeddingService:
             texts: List of text passages to embed.
 
         Returns:
-            numpy array of shape (n, embedding_dimensions).
+            float32 numpy array of shape (n, embedding_dimensions).
         """
         if not texts:
-            return np.array([])
+            return np.empty(
+                (0, self.config.semantic.embedding_dimensions),
+                dtype=EMBEDDING_DTYPE
+            )
 
         self._ensure_client()
 
-        prefixed_texts = [f"passage: {text}" for text in texts]
-        embeddings = self._embed_batch(prefixed_texts)
+        # Prefixed once here; batches are slices of this list
+        prefixed_texts = [PASSAGE_PREFIX + text for text in texts]
 
-        return np.array(embeddings)
+        return self._embed_batch(prefixed_texts)
 
     def embed_query(self, query: str) -> np.ndarray:
         """
@@ -89,50 +125,87 @@ class EmbeddingService:
             query: Search query text.
 
         Returns:
-            numpy array of shape (embedding_dimensions,).
+            float32 numpy array of shape (embedding_dimensions,).
         """
         if not query:
-            return np.array([])
+            return np.empty(0, dtype=EMBEDDING_DTYPE)
 
         self._ensure_client()
 
-        prefixed_query = f"query: {query}"
-        embeddings = self._embed_batch([prefixed_query])
+        prefixed_query = QUERY_PREFIX + query
 
-        return np.array(embeddings[0])
+        return self._embed_batch([prefixed_query])[0]
 
-    def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for a batch of texts.
 
         Handles batching according to configured batch size.
         Includes retry logic for server errors and auto-split for token limits.
+        Up to max_parallel_requests batches are sent concurrently, and each
+        is written straight into a preallocated float32 array.
 
         Args:
             texts: List of texts to embed (already prefixed).
 
         Returns:
-            List of embedding vectors.
+            numpy array of shape (len(texts), embedding_dimensions), float32.
         """
         batch_size = self.config.semantic.embedding_batch_size
-        all_embeddings = []
-
-        for i in range(0, len(texts), batch_size):
-            batch = texts[i:i + batch_size]
-            batch_embeddings = self._embed_batch_with_resilience(batch)
-            all_embeddings.extend(batch_embeddings)
-
-            if len(texts) > batch_size:
-                logger.debug(f"Embedded batch {i // batch_size + 1}/{(len(texts) + batch_size - 1) // batch_size}")
-
-        return all_embeddings
+        embeddings = np.empty(
+            (len(texts), self.config.semantic.embedding_dimensions),
+            dtype=EMBEDDING_DTYPE
+        )
 
-    def _embed_batch_with_resilience(self, texts: List[str]) -> List[List[float]]:
+        starts = range(0, len(texts), batch_size)
+        batches = (texts[i:i + batch_size] for i in starts)
+        max_workers = min(self.config.semantic.max_parallel_requests, len(starts))
+
+        if max_workers <= 1:
+            for i, batch in zip(starts, batches):
+                embeddings[i:i + len(batch)] = self._embed_batch_with_resilience(batch)
+
+                if len(starts) > 1:
+                    logger.debug(f"Embedded batch {i // batch_size + 1}/{len(starts)}")
+
+            return embeddings
+
+        # Batches are independent requests; issue them concurrently.
+        # A failure or Ctrl+C (which only reaches this thread) sets `cancel`
+        # so retrying workers stop and batches not yet started are dropped.
+        cancel = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = {
+                executor.submit(self._embed_batch_with_resilience, batch, cancel): i
+                for i, batch in zip(starts, batches)
+            }
+
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                batch_embeddings = future.result()
+                embeddings[i:i + len(batch_embeddings)] = batch_embeddings
+                logger.debug(f"Embedded batch {done}/{len(starts)}")
+        except BaseException:
+            cancel.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+        executor.shutdown()
+        return embeddings
+
+    def _embed_batch_with_resilience(
+        self,
+        texts: List[str],
+        cancel: Optional[threading.Event] = None
+    ) -> List[List[float]]:
         """
         Embed a batch with unlimited retry on server errors and auto-split on token limits.
 
         Args:
             texts: List of texts to embed.
+            cancel: Event set by the caller to abandon the batch; checked
+                before each request and while waiting to retry.
 
         Returns:
             List of embedding vectors.
@@ -141,6 +214,7 @@ class EmbeddingService:
         start_time = time.time()
 
         while True:
+            _raise_if_cancelled(cancel)
             try:
                 response = self._client.embeddings.create(
                     model=self.config.semantic.embedding_model,
@@ -155,7 +229,7 @@ class EmbeddingService:
                 # Handle token limit exceeded (400 error)
                 if status_code == 400 and "ContextWindowExceeded" in error_message:
                     logger.warning(f"Token limit exceeded, splitting {len(texts)} texts")
-                    return self._embed_with_split(texts)
+                    return self._embed_with_split(texts, cancel)
 
                 # Handle server errors (500, 502, 503, 504) - retry indefinitely
                 if status_code >= 500:
@@ -170,13 +244,16 @@ class EmbeddingService:
                             f"Retry #{retry_count}, elapsed: {elapsed}s. "
                             f"Next retry in {int(delay)}s. (Ctrl+C to cancel)"
                         )
-                        print(
-                            f"\r[Server unavailable] Retry #{retry_count}, "
-                            f"waiting {int(delay)}s... (elapsed: {elapsed}s, Ctrl+C to cancel)",
-                            end="", flush=True
-                        )
-
-                    time.sleep(delay)
+                        # Worker threads share the console; only the main
+                        # thread owns the one-line progress display
+                        if threading.current_thread() is threading.main_thread():
+                            print(
+                                f"\r[Server unavailable] Retry #{retry_count}, "
+                                f"waiting {int(delay)}s... (elapsed: {elapsed}s, Ctrl+C to cancel)",
+                                end="", flush=True
+                            )
+
+                    _wait_before_retry(delay, cancel)
                     continue
 
                 # Other client errors - don't retry
@@ -194,14 +271,18 @@ class EmbeddingService:
                         f"Error: {str(e)[:100]}"
                     )
 
-                time.sleep(delay)
+                _wait_before_retry(delay, cancel)
                 continue
 
             except KeyboardInterrupt:
                 logger.info("Embedding interrupted by user")
                 raise
 
-    def _embed_with_split(self, texts: List[str]) -> List[List[float]]:
+    def _embed_with_split(
+        self,
+        texts: List[str],
+        cancel: Optional[threading.Event] = None
+    ) -> List[List[float]]:
         """
         Embed texts by splitting those that exceed token limits.
 
@@ -211,6 +292,7 @@ class EmbeddingService:
 
         Args:
             texts: List of texts to embed.
+            cancel: Optional cancellation event, see _embed_batch_with_resilience.
 
         Returns:
             List of embedding vectors.
@@ -218,18 +300,24 @@ class EmbeddingService:
         all_embeddings = []
 
         for text in texts:
-            embedding = self._embed_single_with_split(text)
+            embedding = self._embed_single_with_split(text, cancel=cancel)
             all_embeddings.append(embedding)
 
         return all_embeddings
 
-    def _embed_single_with_split(self, text: str, depth: int = 0) -> List[float]:
+    def _embed_single_with_split(
+        self,
+        text: str,
+        depth: int = 0,
+        cancel: Optional[threading.Event] = None
+    ) -> List[float]:
         """
         Embed a single text, splitting if it exceeds token limit.
 
         Args:
             text: Text to embed.
             depth: Recursion depth (to prevent infinite splitting).
+            cancel: Optional cancellation event, see _embed_batch_with_resilience.
 
         Returns:
             Embedding vector.
@@ -246,6 +334,7 @@ class EmbeddingService:
         start_time = time.time()
 
         while True:
+            _raise_if_cancelled(cancel)
             try:
                 response = self._client.embeddings.create(
                     model=self.config.semantic.embedding_model,
@@ -275,8 +364,8 @@ class EmbeddingService:
                     logger.debug(f"Splitting text at depth {depth}: {len(text)} -> {len(first_half)} + {len(second_half)}")
 
                     # Recursively embed each half
-                    emb1 = self._embed_single_with_split(first_half, depth + 1)
-                    emb2 = self._embed_single_with_split(second_half, depth + 1)
+                    emb1 = self._embed_single_with_split(first_half, depth + 1, cancel)
+                    emb2 = self._embed_single_with_split(second_half, depth + 1, cancel)
 
                     # Average the embeddings
                     return [(a + b) / 2 for a, b in zip(emb1, emb2)]
@@ -290,7 +379,7 @@ class EmbeddingService:
                         elapsed = int(time.time() - start_time)
                         logger.warning(f"Server error {e.status_code}, retry #{retry_count}, elapsed: {elapsed}s")
 
-                    time.sleep(delay)
+                    _wait_before_retry(delay, cancel)
                     continue
 
                 # Other errors - re-raise
@@ -299,7 +388,7 @@ class EmbeddingService:
             except APIError:
                 retry_count += 1
                 delay = min(RETRY_DELAY * (1 + (retry_count - 1) * 0.5), MAX_RETRY_DELAY)
-                time.sleep(delay)
+                _wait_before_retry(delay, cancel)
                 continue
 
             except KeyboardInterrupt:
@@ -322,28 +411,27 @@ class EmbeddingService:
         search_range = min(200, mid // 2)
         search_start = max(0, mid - search_range)
         search_end = min(len(text), mid + search_range)
-        search_region = text[search_start:search_end]
 
         # Look for paragraph break
-        para_pos = search_region.rfind('\n\n')
+        para_pos = text.rfind('\n\n', search_start, search_end)
         if para_pos != -1:
-            return search_start + para_pos + 2
+            return para_pos + 2
 
         # Look for sentence end
         for sep in ['. ', '! ', '? ', '.\n', '!\n', '?\n']:
-            pos = search_region.rfind(sep)
+            pos = text.rfind(sep, search_start, search_end)
             if pos != -1:
-                return search_start + pos + len(sep)
+                return pos + len(sep)
 
         # Look for any newline
-        newline_pos = search_region.rfind('\n')
+        newline_pos = text.rfind('\n', search_start, search_end)
         if newline_pos != -1:
-            return search_start + newline_pos + 1
+            return newline_pos + 1
 
         # Look for space
-        space_pos = search_region.rfind(' ')
+        space_pos = text.rfind(' ', search_start, search_end)
         if space_pos != -1:
-            return search_start + space_pos + 1
+            return space_pos + 1
 
         # Fall back to exact middle
         return mid
@@ -358,6 +446,7 @@ class EmbeddingService:
         return {
             "model": self.config.semantic.embedding_model,
             "dimensions": self.config.semantic.embedding_dimensions,
+            "dtype": EMBEDDING_DTYPE.__name__,
             "endpoint": self.config.semantic.endpoint,
             "initialized": self._initialized
         }
@@ -367,12 +456,18 @@ def get_embedding_service() -> EmbeddingService:
     """
     Get the singleton EmbeddingService instance.
 
+    Uses double-checked locking: the lock is only taken while the
+    instance does not exist yet, so concurrent first calls still share
+    one instance and later calls never contend.
+
     Returns:
         Global EmbeddingService instance.
     """
     global _embedding_service
     if _embedding_service is None:
-        _embedding_service = EmbeddingService()
+        with _embedding_service_lock:
+            if _embedding_service is None:
+                _embedding_service = EmbeddingService()
     return _embedding_service
 
 
@@ -6,9 +6,12 @@ and Reciprocal Rank Fusion for combining results.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from ..core import get_config, get_logger
 from .bm25_engine import BM25Engine
@@ -242,31 +245,41 @@ class HybridEngine:
         semantic_weight: float,
         stats: HybridSearchStats
     ) -> List[HybridSearchResult]:
-        """Execute hybrid search with RRF fusion."""
+        """
+        Execute hybrid search with RRF fusion.
+
+        Both sub-engines run concurrently on a two-worker pool: the
+        lexical side waits on SQLite and the semantic side on the
+        embedding API, so wall time is the slower of the two rather
+        than their sum. A failing engine only drops its own results.
+        """
         fetch_limit = limit * 2
 
-        lexical_start = time.time()
-        lexical_results = []
-        try:
-            search_query = SearchQuery(text=query, limit=fetch_limit)
-            bm25_results, _ = self.bm25_engine.search(search_query)
-            lexical_results = bm25_results
-            stats.lexical_results = len(lexical_results)
-        except Exception as e:
-            logger.warning(f"Lexical search failed in hybrid mode: {e}")
-            stats.errors.append(f"Lexical search error: {str(e)}")
-        stats.lexical_time_ms = round((time.time() - lexical_start) * 1000, 2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            lexical_future = executor.submit(
+                self._timed_search,
+                self.bm25_engine.search,
+                SearchQuery(text=query, limit=fetch_limit)
+            )
+            semantic_future = executor.submit(
+                self._timed_search,
+                self.semantic_engine.search,
+                query,
+                fetch_limit
+            )
 
-        semantic_start = time.time()
-        semantic_results = []
-        try:
-            sem_results, _ = self.semantic_engine.search(query, fetch_limit)
-            semantic_results = sem_results
-            stats.semantic_results = len(semantic_results)
-        except Exception as e:
-            logger.warning(f"Semantic search failed in hybrid mode: {e}")
-            stats.errors.append(f"Semantic search error: {str(e)}")
-        stats.semantic_time_ms = round((time.time() - semantic_start) * 1000, 2)
+            lexical_results, lexical_error, stats.lexical_time_ms = lexical_future.result()
+            semantic_results, semantic_error, stats.semantic_time_ms = semantic_future.result()
+
+        if lexical_error is not None:
+            logger.warning(f"Lexical search failed in hybrid mode: {lexical_error}")
+            stats.errors.append(f"Lexical search error: {str(lexical_error)}")
+        stats.lexical_results = len(lexical_results)
+
+        if semantic_error is not None:
+            logger.warning(f"Semantic search failed in hybrid mode: {semantic_error}")
+            stats.errors.append(f"Semantic search error: {str(semantic_error)}")
+        stats.semantic_results = len(semantic_results)
 
         if not lexical_results and not semantic_results:
             return []
@@ -288,6 +301,51 @@ class HybridEngine:
 
         return fused_results
 
+    @staticmethod
+    def _timed_search(
+        search_fn: Callable,
+        *args
+    ) -> Tuple[list, Optional[Exception], float]:
+        """
+        Run one sub-engine search on a worker thread.
+
+        Errors are returned instead of raised so the caller can record
+        them in order and degrade to the other engine's results.
+
+        Returns:
+            Tuple of (results, error or None, elapsed time in ms).
+        """
+        start = time.time()
+
+        try:
+            results, _ = search_fn(*args)
+            error = None
+        except Exception as e:
+            results, error = [], e
+
+        return results, error, round((time.time() - start) * 1000, 2)
+
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, limit: int) -> np.ndarray:
+        """
+        Indices of the `limit` highest scores, best first.
+
+        Same result as a stable descending argsort truncated to `limit`,
+        but only the candidates at or above the limit-th score are
+        sorted. Every index tied with the cutoff is kept as a candidate,
+        so equal scores still come out in index order.
+        """
+        n = len(scores)
+        if limit <= 0:
+            return np.empty(0, dtype=np.intp)
+        if limit >= n:
+            return np.argsort(-scores, kind="stable")
+
+        cutoff = np.partition(scores, n - limit)[n - limit]
+        candidates = np.flatnonzero(scores >= cutoff)
+        order = np.argsort(-scores[candidates], kind="stable")
+        return candidates[order[:limit]]
+
     def _apply_rrf_fusion(
         self,
         lexical_results: list,
@@ -301,58 +359,51 @@ class HybridEngine:
         Apply Reciprocal Rank Fusion to combine result sets.
 
         RRF score = sum(weight * 1/(k + rank)) for each result set.
+
+        Each distinct page gets a dense integer id, contributions are
+        scattered into one score array per result set, and the top
+        `limit` are selected by _top_k_indices. Ties keep first-seen order,
+        lexical first.
         """
-        scores: Dict[str, float] = {}
-        result_data: Dict[str, dict] = {}
-        lexical_ranks: Dict[str, int] = {}
-        semantic_ranks: Dict[str, int] = {}
-        semantic_similarities: Dict[str, float] = {}
+        index: Dict[str, int] = {}
+        result_data: List[dict] = []
 
-        for rank, r in enumerate(lexical_results, 1):
-            key = f"{r.filepath}:{r.page_num}"
-            rrf_score = lexical_weight * (1.0 / (self.rrf_k + rank))
-            scores[key] = scores.get(key, 0) + rrf_score
-            lexical_ranks[key] = rank
+        lexical_ids = self._assign_dense_ids(lexical_results, "id", index, result_data)
+        semantic_ids = self._assign_dense_ids(
+            semantic_results, "document_id", index, result_data
+        )
 
-            if key not in result_data:
-                result_data[key] = {
-                    "document_id": r.id,
-                    "filepath": r.filepath,
-                    "filename": r.filename,
-                    "page_num": r.page_num,
-                    "relative_path": r.relative_path,
-                    "snippet": r.snippet
-                }
+        lexical_rank_values = np.arange(1, len(lexical_ids) + 1)
+        semantic_rank_values = np.arange(1, len(semantic_ids) + 1)
 
-        for rank, r in enumerate(semantic_results, 1):
-            key = f"{r.filepath}:{r.page_num}"
-            rrf_score = semantic_weight * (1.0 / (self.rrf_k + rank))
-            scores[key] = scores.get(key, 0) + rrf_score
-            semantic_ranks[key] = rank
-            semantic_similarities[key] = r.similarity
-
-            if key not in result_data:
-                result_data[key] = {
-                    "document_id": r.document_id,
-                    "filepath": r.filepath,
-                    "filename": r.filename,
-                    "page_num": r.page_num,
-                    "relative_path": r.relative_path,
-                    "snippet": r.snippet
-                }
+        scores = np.zeros(len(result_data), dtype=np.float64)
+        np.add.at(
+            scores, lexical_ids,
+            lexical_weight * (1.0 / (self.rrf_k + lexical_rank_values))
+        )
+        np.add.at(
+            scores, semantic_ids,
+            semantic_weight * (1.0 / (self.rrf_k + semantic_rank_values))
+        )
+
+        # Rank 0 means "not found by this method"
+        lexical_ranks = np.zeros(len(result_data), dtype=np.int64)
+        lexical_ranks[lexical_ids] = lexical_rank_values
+        semantic_ranks = np.zeros(len(result_data), dtype=np.int64)
+        semantic_ranks[semantic_ids] = semantic_rank_values
 
-        lexical_keys = set(lexical_ranks.keys())
-        semantic_keys = set(semantic_ranks.keys())
-        overlap_keys = lexical_keys & semantic_keys
-        stats.overlap_count = len(overlap_keys)
+        similarities = np.zeros(len(result_data), dtype=np.float64)
+        similarities[semantic_ids] = [r.similarity for r in semantic_results]
 
-        sorted_keys = sorted(scores.keys(), key=lambda k: scores[k], reverse=True)
+        stats.overlap_count = int(np.count_nonzero((lexical_ranks > 0) & (semantic_ranks > 0)))
+
+        top_ids = self._top_k_indices(scores, limit)
 
         results = []
-        for key in sorted_keys[:limit]:
-            data = result_data[key]
-            lex_rank = lexical_ranks.get(key)
-            sem_rank = semantic_ranks.get(key)
+        for i in top_ids:
+            data = result_data[i]
+            lex_rank = int(lexical_ranks[i]) or None
+            sem_rank = int(semantic_ranks[i]) or None
 
             if lex_rank and sem_rank:
                 source = "both"
@@ -368,15 +419,48 @@ class HybridEngine:
                 page_num=data["page_num"],
                 relative_path=data["relative_path"],
                 snippet=data["snippet"],
-                score=scores[key],
+                score=float(scores[i]),
                 source=source,
                 lexical_rank=lex_rank,
                 semantic_rank=sem_rank,
-                similarity=semantic_similarities.get(key)
+                similarity=float(similarities[i]) if sem_rank else None
             ))
 
         return results
 
+    @staticmethod
+    def _assign_dense_ids(
+        results: list,
+        id_attr: str,
+        index: Dict[str, int],
+        result_data: List[dict]
+    ) -> np.ndarray:
+        """
+        Map each result's page key to a dense integer id.
+
+        New pages are appended to index and result_data; pages already
+        seen keep their first-seen id and display data.
+        """
+        ids = np.empty(len(results), dtype=np.int64)
+
+        for position, r in enumerate(results):
+            key = f"{r.filepath}:{r.page_num}"
+            dense_id = index.setdefault(key, len(index))
+
+            if dense_id == len(result_data):
+                result_data.append({
+                    "document_id": getattr(r, id_attr),
+                    "filepath": r.filepath,
+                    "filename": r.filename,
+                    "page_num": r.page_num,
+                    "relative_path": r.relative_path,
+                    "snippet": r.snippet
+                })
+
+            ids[position] = dense_id
+
+        return ids
+
     def _convert_lexical_results(self, results: list) -> List[HybridSearchResult]:
         """Convert BM25 results to HybridSearchResult format."""
         return [
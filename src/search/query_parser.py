@@ -6,6 +6,7 @@ Supports both basic (implicit AND) and advanced query modes.
 """
 
 import re
+from functools import lru_cache
 from typing import List
 
 from ..core import get_logger
@@ -17,6 +18,22 @@ logger = get_logger(__name__)
 # Note: '.' is the column filter operator in FTS5 (e.g., "filename:term")
 FTS5_SPECIAL_CHARS = set('"\'*-+():^.')
 
+# Compiled once at import; every parse call reuses these patterns
+_SPECIAL_CHARS_RE = re.compile(
+    "[" + re.escape("".join(sorted(FTS5_SPECIAL_CHARS))) + "]"
+)
+_OPERATOR_RE = re.compile(r'\b(OR|AND|NOT)\b', re.IGNORECASE)
+
+# Advanced-mode tokens: a complete quoted phrase, or a run of non-space,
+# non-quote characters. Matches never backtrack, so tokenizing is linear.
+_ADVANCED_TOKEN_RE = re.compile(r'"[^"]*"|[^\s"]+')
+
+# Boolean operators understood by FTS5 MATCH
+FTS5_OPERATORS = ("OR", "AND", "NOT")
+
+# Parsed queries kept per parser and mode, keyed by the raw query text
+PARSE_CACHE_SIZE = 1024
+
 
 class QueryParser:
     """
@@ -26,6 +43,14 @@ class QueryParser:
     (preserving operators like OR, NOT, and quoted phrases).
     """
 
+    def __init__(self):
+        """Initialize the parser with its parsed query caches."""
+        # Engines parse the same texts again on paging and repeated searches
+        self._parse_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(self._parse)
+        self._parse_advanced_cached = lru_cache(maxsize=PARSE_CACHE_SIZE)(
+            self._parse_advanced
+        )
+
     def parse(self, query: str) -> str:
         """
         Parse query in basic mode.
@@ -39,18 +64,16 @@ class QueryParser:
         Returns:
             Sanitized query string safe for FTS5 MATCH.
         """
+        return self._parse_cached(query)
+
+    def _parse(self, query: str) -> str:
+        """Uncached basic mode parsing, see parse()."""
         if not query or not query.strip():
             return ""
 
-        cleaned = "".join(
-            char if char not in FTS5_SPECIAL_CHARS else " "
-            for char in query
-        )
+        cleaned = _SPECIAL_CHARS_RE.sub(" ", query)
 
-        terms = cleaned.split()
-        terms = [term.strip() for term in terms if term.strip()]
-
-        return " ".join(terms)
+        return " ".join(cleaned.split())
 
     def parse_advanced(self, query: str) -> str:
         """
@@ -61,37 +84,35 @@ class QueryParser:
         - Quoted phrases "like this"
         - Prefix wildcards term*
 
+        Operators are pushed down to FTS5 as-is, so exclusion and union
+        happen inside the index. Operators with no operand, which FTS5
+        rejects as syntax errors, are dropped; NOT always stays attached
+        to the term it negates.
+
         Args:
             query: Raw user input with FTS5 syntax.
 
         Returns:
             Sanitized query with valid operators preserved.
         """
+        return self._parse_advanced_cached(query)
+
+    def _parse_advanced(self, query: str) -> str:
+        """Uncached advanced mode parsing, see parse_advanced()."""
         if not query or not query.strip():
             return ""
 
-        # Extract and protect quoted phrases
-        phrases = []
-        protected_query = query
-
-        for match in re.finditer(r'"([^"]*)"', query):
-            placeholder = f"__PHRASE_{len(phrases)}__"
-            phrases.append(match.group(0))
-            protected_query = protected_query.replace(match.group(0), placeholder, 1)
-
-        tokens = protected_query.split()
         result_tokens = []
 
-        for token in tokens:
+        for token in _ADVANCED_TOKEN_RE.findall(query):
             upper = token.upper()
 
-            if upper in ("OR", "AND", "NOT"):
+            if upper in FTS5_OPERATORS:
                 result_tokens.append(upper)
                 continue
 
-            if token.startswith("__PHRASE_") and token.endswith("__"):
-                idx = int(token[9:-2])
-                result_tokens.append(phrases[idx])
+            if token.startswith('"'):
+                result_tokens.append(token)
                 continue
 
             if token.endswith("*"):
@@ -104,14 +125,49 @@ class QueryParser:
             if clean_token:
                 result_tokens.append(clean_token)
 
-        return " ".join(result_tokens)
+        return " ".join(self._drop_dangling_operators(result_tokens))
+
+    def _drop_dangling_operators(self, tokens: List[str]) -> List[str]:
+        """
+        Remove operators that have no operand, keeping negated terms.
+
+        OR and AND need a term on both sides. NOT x is a negated term:
+        "AND NOT x" is folded into FTS5's binary "NOT x", and leading
+        negated terms are moved after the first term they are ANDed with,
+        so "NOT x y" becomes "y NOT x". A negated term with nothing to
+        exclude from, such as "a OR NOT b", is left for FTS5 to reject
+        rather than rewritten into a query with a different meaning.
+        """
+        result: List[str] = []
+
+        for token in tokens:
+            if token == "NOT":
+                if result and result[-1] == "AND":
+                    result[-1] = token
+                elif not result or result[-1] != "NOT":
+                    result.append(token)
+            elif token in FTS5_OPERATORS:
+                if result and result[-1] not in FTS5_OPERATORS:
+                    result.append(token)
+            else:
+                result.append(token)
+
+        while result and result[-1] in FTS5_OPERATORS:
+            result.pop()
+
+        # Leading "NOT x" pairs, then the term they can be attached to
+        negated = 0
+        while negated < len(result) and result[negated] == "NOT":
+            negated += 2
+
+        if 0 < negated < len(result) and result[negated] not in FTS5_OPERATORS:
+            result = [result[negated]] + result[:negated] + result[negated + 1:]
+
+        return result
 
     def _clean_term(self, term: str) -> str:
         """Remove special characters from a single term."""
-        return "".join(
-            char for char in term
-            if char not in FTS5_SPECIAL_CHARS
-        ).strip()
+        return _SPECIAL_CHARS_RE.sub("", term).strip()
 
     def extract_terms(self, query: str) -> List[str]:
         """
@@ -126,7 +182,7 @@ class QueryParser:
             List of individual terms.
         """
         # Remove operators and quotes
-        cleaned = re.sub(r'\b(OR|AND|NOT)\b', ' ', query, flags=re.IGNORECASE)
+        cleaned = _OPERATOR_RE.sub(' ', query)
         cleaned = cleaned.replace('"', ' ')
         cleaned = cleaned.replace('*', '')
 
@@ -5,17 +5,28 @@ Orchestrates embedding generation and vector search to find
 semantically similar documents.
 """
 
+import threading
 import time
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 
 from ..core import get_config, get_logger
 from ..database import get_connection
-from ..database.vector_repository import VectorRepository
+from ..database.vector_repository import VectorRepository, VectorSearchResult, normalize_rows
+from ..utils import truncate_text
 from .embedding_service import get_embedding_service
 
 logger = get_logger(__name__)
 
+# Documents whose metadata is kept in memory by each engine
+DOCUMENT_CACHE_SIZE = 4096
+
+# Appended to snippets cut from longer chunks
+SNIPPET_SUFFIX = "..."
+
 
 @dataclass
 class SemanticSearchResult:
@@ -53,12 +64,25 @@ class SemanticSearchStats:
         execution_time_ms: Total execution time in milliseconds.
         embedding_time_ms: Time spent generating query embedding.
         search_time_ms: Time spent in vector search.
+        cache_hit: Whether results came from the query cache.
     """
     query: str
     total_results: int
     execution_time_ms: float
     embedding_time_ms: float
     search_time_ms: float
+    cache_hit: bool = False
+
+
+# Query cache key: query text, limit and min_similarity
+_QueryKey = Tuple[str, int, float]
+
+
+@dataclass
+class _CachedSearch:
+    """Results of one search, kept for repeats of the exact same query."""
+    results: List[SemanticSearchResult]
+    created_at: float
 
 
 class SemanticEngine:
@@ -75,7 +99,19 @@ class SemanticEngine:
         self.embedding_service = get_embedding_service()
         self.vector_repo = VectorRepository()
         self.snippet_length = self.config.search.snippet_length
-        self._document_cache: Dict[int, dict] = {}
+        self._document_cache: "OrderedDict[int, dict]" = OrderedDict()
+        self.document_cache_size = DOCUMENT_CACHE_SIZE
+
+        semantic_config = self.config.semantic
+        self.query_cache_size = semantic_config.query_cache_size
+        self.query_cache_ttl = semantic_config.query_cache_ttl_seconds
+        self._query_cache: "OrderedDict[_QueryKey, _CachedSearch]" = OrderedDict()
+        self._index_version: Optional[int] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # One engine may serve several GUI sessions at once
+        self._cache_lock = threading.Lock()
 
     def search(
         self,
@@ -105,20 +141,84 @@ class SemanticEngine:
                 search_time_ms=0
             )
 
-        embed_start = time.time()
-        query_embedding = self.embedding_service.embed_query(query)
-        embedding_time = (time.time() - embed_start) * 1000
+        embedding_time = search_time = 0.0
+        vector_results = None
+
+        # Repeating the exact same query skips the embedding request too
+        cache_key = (query, limit, min_similarity)
+        index_version = self._check_index_version() if self.query_cache_size > 0 else None
+        results = self._lookup_query_cache(cache_key, index_version)
+
+        if results is None:
+            embed_start = time.time()
+            # Normalized once here so the repository does not copy it again
+            query_embedding = normalize_rows(self.embedding_service.embed_query(query))
+            embedding_time = (time.time() - embed_start) * 1000
+
+            search_start = time.time()
+            vector_results = self.vector_repo.search_similar(
+                query_embedding, limit, normalized=True
+            )
+            search_time = (time.time() - search_start) * 1000
 
-        search_start = time.time()
-        vector_results = self.vector_repo.search_similar(query_embedding, limit)
-        search_time = (time.time() - search_start) * 1000
+        cache_hit = vector_results is None
+        if not cache_hit:
+            results = self._enrich_results(vector_results, min_similarity)
+            self._store_query_cache(cache_key, results, index_version)
+
+        with self._cache_lock:
+            if cache_hit:
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+
+        total_time = (time.time() - start_time) * 1000
+
+        stats = SemanticSearchStats(
+            query=query,
+            total_results=len(results),
+            execution_time_ms=round(total_time, 2),
+            embedding_time_ms=round(embedding_time, 2),
+            search_time_ms=round(search_time, 2),
+            cache_hit=cache_hit
+        )
+
+        logger.debug(
+            f"Semantic search '{query}': {len(results)} results in {total_time:.1f}ms "
+            f"(embed: {embedding_time:.1f}ms, search: {search_time:.1f}ms)"
+        )
+
+        return results, stats
+
+    def _enrich_results(
+        self,
+        vector_results: List[VectorSearchResult],
+        min_similarity: float
+    ) -> List[SemanticSearchResult]:
+        """
+        Attach document metadata and snippets to vector search results.
+
+        Args:
+            vector_results: Chunks returned by the vector repository,
+                ordered by similarity (descending).
+            min_similarity: Minimum similarity threshold (0-1).
+
+        Returns:
+            List of SemanticSearchResult in the same order.
+        """
+        # Results arrive sorted by similarity, so the threshold is a cut point
+        similarities = np.fromiter(
+            (vr.similarity for vr in vector_results),
+            dtype=np.float64,
+            count=len(vector_results)
+        )
+        cut = int(np.searchsorted(-similarities, -min_similarity, side="right"))
+        vector_results = vector_results[:cut]
+        documents = self._get_documents_info(vr.document_id for vr in vector_results)
 
         results = []
         for vr in vector_results:
-            if vr.similarity < min_similarity:
-                continue
-
-            doc_info = self._get_document_info(vr.document_id)
+            doc_info = documents.get(vr.document_id)
             if not doc_info:
                 continue
 
@@ -135,26 +235,118 @@ class SemanticEngine:
                 similarity=vr.similarity
             ))
 
-        total_time = (time.time() - start_time) * 1000
+        return results
 
-        stats = SemanticSearchStats(
-            query=query,
-            total_results=len(results),
-            execution_time_ms=round(total_time, 2),
-            embedding_time_ms=round(embedding_time, 2),
-            search_time_ms=round(search_time, 2)
-        )
+    def _lookup_query_cache(
+        self,
+        key: _QueryKey,
+        index_version: Optional[int]
+    ) -> Optional[List[SemanticSearchResult]]:
+        """
+        Find cached results for exactly this query text and parameters.
 
-        logger.debug(
-            f"Semantic search '{query}': {len(results)} results in {total_time:.1f}ms "
-            f"(embed: {embedding_time:.1f}ms, search: {search_time:.1f}ms)"
-        )
+        An expired entry is dropped instead of returned. Nothing is served
+        while the index version is unknown.
 
-        return results, stats
+        Args:
+            key: Tuple of (query, limit, min_similarity).
+            index_version: Version from _check_index_version(), or None.
+
+        Returns:
+            Copies of the cached results, so callers may modify them,
+            or None on a miss.
+        """
+        if self.query_cache_size <= 0 or index_version is None:
+            return None
+
+        with self._cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is None:
+                return None
+
+            if time.time() - entry.created_at > self.query_cache_ttl:
+                del self._query_cache[key]
+                return None
+
+            self._query_cache.move_to_end(key)
+            return [replace(result) for result in entry.results]
+
+    def _store_query_cache(
+        self,
+        key: _QueryKey,
+        results: List[SemanticSearchResult],
+        index_version: Optional[int]
+    ) -> None:
+        """
+        Cache search results, evicting the least recently used entry.
+
+        Results are only stored if the index version they were searched
+        under is known and still current, so a search racing an index
+        change cannot cache stale results.
+        """
+        if self.query_cache_size <= 0 or index_version is None:
+            return
+
+        with self._cache_lock:
+            if index_version != self._index_version:
+                return
+
+            self._query_cache[key] = _CachedSearch(
+                results=[replace(result) for result in results],
+                created_at=time.time()
+            )
+            self._query_cache.move_to_end(key)
+
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+
+    def _check_index_version(self) -> Optional[int]:
+        """
+        Clear the caches if documents or chunks changed since the last check.
+
+        The version counter in documents_stats is bumped by triggers on
+        every write to documents and chunks_metadata, so rebuilds done by
+        another process are noticed too.
+
+        Returns:
+            The current version, or None if the stats row is missing.
+        """
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT version FROM documents_stats WHERE id = 1"
+            ).fetchone()
+        version = row["version"] if row is not None else None
+
+        with self._cache_lock:
+            if version is None or version != self._index_version:
+                self._document_cache.clear()
+                self._query_cache.clear()
+                self._index_version = version
+
+        return version
+
+    def cache_info(self) -> dict:
+        """
+        Get query cache counters.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate and current size.
+        """
+        with self._cache_lock:
+            hits, misses = self.cache_hits, self.cache_misses
+            size = len(self._query_cache)
+
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "size": size
+        }
 
     def _get_document_info(self, document_id: int) -> Optional[dict]:
         """
-        Get document metadata, using cache for efficiency.
+        Get document metadata, using an LRU cache for efficiency.
 
         Args:
             document_id: Document ID to look up.
@@ -162,28 +354,58 @@ class SemanticEngine:
         Returns:
             Dictionary with filepath, filename, relative_path or None.
         """
-        if document_id in self._document_cache:
-            return self._document_cache[document_id]
+        return self._get_documents_info([document_id]).get(document_id)
+
+    def _get_documents_info(self, document_ids: Iterable[int]) -> Dict[int, dict]:
+        """
+        Get metadata for several documents with at most one query.
+
+        Cached documents are served from the LRU cache; the rest are
+        fetched together with a single IN (...) lookup.
+
+        Args:
+            document_ids: Document IDs to look up.
+
+        Returns:
+            Dictionary mapping each found ID to its filepath, filename
+            and relative_path. Unknown IDs are left out.
+        """
+        found: Dict[int, dict] = {}
+        missing = []
 
+        with self._cache_lock:
+            for document_id in dict.fromkeys(document_ids):
+                if document_id in self._document_cache:
+                    self._document_cache.move_to_end(document_id)
+                    found[document_id] = self._document_cache[document_id]
+                else:
+                    missing.append(document_id)
+
+        if not missing:
+            return found
+
+        placeholders = ",".join("?" * len(missing))
         with get_connection() as conn:
-            row = conn.execute("""
-                SELECT filepath, filename, relative_path
+            rows = conn.execute(f"""
+                SELECT id, filepath, filename, relative_path
                 FROM documents
-                WHERE id = ?
-                LIMIT 1
-            """, (document_id,)).fetchone()
+                WHERE id IN ({placeholders})
+            """, missing).fetchall()
 
-            if not row:
-                return None
+        with self._cache_lock:
+            for row in rows:
+                doc_info = {
+                    "filepath": row["filepath"],
+                    "filename": row["filename"],
+                    "relative_path": row["relative_path"]
+                }
+                found[row["id"]] = doc_info
+                self._document_cache[row["id"]] = doc_info
 
-            doc_info = {
-                "filepath": row["filepath"],
-                "filename": row["filename"],
-                "relative_path": row["relative_path"]
-            }
+            while len(self._document_cache) > self.document_cache_size:
+                self._document_cache.popitem(last=False)
 
-            self._document_cache[document_id] = doc_info
-            return doc_info
+        return found
 
     def _generate_snippet(self, content: str) -> str:
         """
@@ -193,18 +415,12 @@ class SemanticEngine:
             content: Full chunk text.
 
         Returns:
-            Truncated snippet suitable for display.
+            The content unchanged if it fits in snippet_length plus the
+            length of "...", otherwise at most snippet_length characters
+            cut at a word boundary where possible, followed by "...".
         """
-        if len(content) <= self.snippet_length:
-            return content
-
-        truncated = content[:self.snippet_length]
-        last_space = truncated.rfind(" ")
-
-        if last_space > self.snippet_length * 0.7:
-            truncated = truncated[:last_space]
-
-        return truncated + "..."
+        max_length = self.snippet_length + len(SNIPPET_SUFFIX)
+        return truncate_text(content, max_length, SNIPPET_SUFFIX)
 
     def get_index_stats(self) -> dict:
         """
@@ -224,8 +440,10 @@ class SemanticEngine:
         }
 
     def clear_cache(self) -> None:
-        """Clear the document info cache."""
-        self._document_cache.clear()
+        """Clear the document info and query caches, e.g. after reindexing."""
+        with self._cache_lock:
+            self._document_cache.clear()
+            self._query_cache.clear()
 
 
 if __name__ == "__main__":
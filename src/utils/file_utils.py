@@ -6,23 +6,30 @@ size calculations, path manipulation, and directory management.
 """
 
 import hashlib
+import os
 from pathlib import Path
 from typing import Union
 
+# Length of the hex digests returned by get_file_hash (SHA-256)
+HASH_HEX_LEN = hashlib.sha256().digest_size * 2
+
 
 def get_file_hash(filepath: Union[str, Path], chunk_size: int = 8192) -> str:
     """
-    Compute MD5 hash of the first chunk of a file for fast change detection.
+    Compute SHA-256 hash of the first chunk of a file for fast change detection.
+
+    SHA-256 runs on the CPU's SHA extensions where OpenSSL detects them,
+    which makes it faster than MD5 on current hardware.
 
     Args:
         filepath: Path to the file.
         chunk_size: Number of bytes to read (default 8KB).
 
     Returns:
-        Hexadecimal MD5 hash string.
+        Hexadecimal SHA-256 hash string of HASH_HEX_LEN characters.
     """
     filepath = Path(filepath)
-    hasher = hashlib.md5()
+    hasher = hashlib.sha256()
 
     with open(filepath, "rb") as f:
         chunk = f.read(chunk_size)
@@ -41,29 +48,40 @@ def get_file_size_mb(filepath: Union[str, Path]) -> float:
     Returns:
         File size in MB, rounded to 2 decimal places.
     """
-    filepath = Path(filepath)
-    size_bytes = filepath.stat().st_size
-    return round(size_bytes / (1024 * 1024), 2)
+    return round(os.path.getsize(filepath) / (1024 * 1024), 2)
 
 
-def get_relative_path(filepath: Union[str, Path], base: Union[str, Path]) -> str:
+def get_relative_path(
+    filepath: Union[str, Path],
+    base: Union[str, Path],
+    base_resolved: bool = False
+) -> str:
     """
     Compute relative path from base directory.
 
     Args:
         filepath: Absolute path to the file.
         base: Base directory to compute relative path from.
+        base_resolved: Whether base already went through os.path.realpath,
+            in which case it is not resolved again. Lets callers computing
+            many paths against one base resolve it once.
 
     Returns:
         Relative path as string, or absolute path if not relative to base.
     """
-    filepath = Path(filepath).resolve()
-    base = Path(base).resolve()
+    filepath = os.path.realpath(filepath)
+    if not base_resolved:
+        base = os.path.realpath(base)
 
     try:
-        return str(filepath.relative_to(base))
+        relative = os.path.relpath(filepath, base)
     except ValueError:
-        return str(filepath)
+        # Different drive on Windows
+        return filepath
+
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return filepath
+    return relative
 
 
 def ensure_directory(path: Union[str, Path]) -> Path:
@@ -7,7 +7,19 @@ for processing extracted PDF content.
 
 import re
 import unicodedata
-from typing import List
+from typing import Dict, List
+
+# C0/C1 control characters except newline (\x0a) and tab (\x09)
+_RE_CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f-\x9f]")
+
+# Whitespace cleanup patterns, compiled once at import. Runs of spaces
+# and tabs only match where a replacement changes something (any tab, or
+# two or more characters), so single spaces between words are skipped.
+_RE_MULTISPACE = re.compile(r"\t[ \t]*| [ \t]+")
+_RE_MULTINEWLINE = re.compile(r"\n{3,}")
+
+# Compiled keyword patterns, one per minimum word length
+_KEYWORD_PATTERNS: Dict[int, re.Pattern] = {}
 
 
 def clean_text(text: str) -> str:
@@ -29,18 +41,23 @@ def clean_text(text: str) -> str:
     # Normalize unicode characters
     text = unicodedata.normalize("NFKC", text)
 
-    # Remove control characters except newlines and tabs
-    text = "".join(
-        char for char in text
-        if not unicodedata.category(char).startswith("C")
-        or char in "\n\t"
-    )
+    # Remove control characters except newlines and tabs. ASCII and
+    # Latin-1 controls go in one C-level pass; the per-character category
+    # scan only runs if a non-printable character is still left.
+    text = _RE_CONTROL_CHARS.sub("", text)
+    if not text.replace("\n", "").replace("\t", "").isprintable():
+        text = "".join(
+            char for char in text
+            if not unicodedata.category(char).startswith("C")
+            or char in "\n\t"
+        )
 
     # Replace multiple spaces/tabs with single space
-    text = re.sub(r"[ \t]+", " ", text)
+    text = _RE_MULTISPACE.sub(" ", text)
 
     # Replace multiple newlines with double newline
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    if "\n\n\n" in text:
+        text = _RE_MULTINEWLINE.sub("\n\n", text)
 
     # Remove leading/trailing whitespace from each line
     lines = [line.strip() for line in text.split("\n")]
@@ -68,14 +85,14 @@ def truncate_text(text: str, max_length: int, suffix: str = "...") -> str:
     if truncate_at <= 0:
         return suffix[:max_length]
 
-    # Try to break at word boundary
-    truncated = text[:truncate_at]
-    last_space = truncated.rfind(" ")
+    # Try to break at word boundary; bounded rfind scans in place, so
+    # only the final slice is copied
+    last_space = text.rfind(" ", 0, truncate_at)
 
     if last_space > truncate_at * 0.7:
-        truncated = truncated[:last_space]
+        truncate_at = last_space
 
-    return truncated + suffix
+    return text[:truncate_at] + suffix
 
 
 def extract_keywords(text: str, min_length: int = 3) -> List[str]:
@@ -83,6 +100,8 @@ def extract_keywords(text: str, min_length: int = 3) -> List[str]:
     Extract keywords from text via simple tokenization.
 
     Splits on non-alphanumeric characters and filters short words.
+    The length filter is part of the regex, so short words are skipped
+    by the matcher instead of in a Python loop.
 
     Args:
         text: Text to extract keywords from.
@@ -94,9 +113,18 @@ def extract_keywords(text: str, min_length: int = 3) -> List[str]:
     if not text:
         return []
 
-    words = re.findall(r"\b[a-zA-ZÀ-ÿ0-9]+\b", text.lower())
+    return _keyword_pattern(min_length).findall(text.lower())
+
+
+def _keyword_pattern(min_length: int) -> re.Pattern:
+    """Get the compiled keyword pattern for a minimum word length."""
+    pattern = _KEYWORD_PATTERNS.get(min_length)
+
+    if pattern is None:
+        pattern = re.compile(r"\b[a-zA-ZÀ-ÿ0-9]{%d,}\b" % max(min_length, 1))
+        _KEYWORD_PATTERNS[min_length] = pattern
 
-    return [word for word in words if len(word) >= min_length]
+    return pattern
 
 
 if __name__ == "__main__":
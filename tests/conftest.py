@@ -10,9 +10,13 @@ No real data is ever modified or accessed.
 
 import json
 import pytest
+import sqlite3
 import tempfile
 import shutil
+import zlib
+from contextlib import closing
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Generator, List
 from unittest.mock import Mock, patch
 
@@ -23,6 +27,11 @@ _project_root = Path(__file__).parent.parent
 if str(_project_root) not in sys.path:
     sys.path.insert(0, str(_project_root))
 
+# Shared pool of fake embeddings, generated once per session. Mock API
+# responses return read-only views into it instead of fresh vectors.
+_EMBEDDING_POOL = np.random.default_rng(0).standard_normal((1024, 1024), dtype=np.float32)
+_EMBEDDING_POOL.flags.writeable = False
+
 
 @pytest.fixture
 def temp_dir() -> Generator[Path, None, None]:
@@ -37,24 +46,23 @@ def temp_dir() -> Generator[Path, None, None]:
     shutil.rmtree(tmp, ignore_errors=True)
 
 
-@pytest.fixture
-def temp_config(temp_dir: Path) -> Generator[Path, None, None]:
+def _write_test_config(root: Path) -> Path:
     """
-    Create a temporary config.json for testing.
+    Write a config.json whose paths all point inside root.
 
     Args:
-        temp_dir: Temporary directory fixture.
+        root: Empty temporary directory.
 
-    Yields:
-        Path to temporary config file.
+    Returns:
+        Path to the written config file.
     """
-    config_dir = temp_dir / "config"
+    config_dir = root / "config"
     config_dir.mkdir()
 
-    data_dir = temp_dir / "data"
+    data_dir = root / "data"
     data_dir.mkdir()
 
-    output_dir = temp_dir / "output"
+    output_dir = root / "output"
     output_dir.mkdir()
 
     logs_dir = output_dir / "logs"
@@ -125,7 +133,41 @@ def temp_config(temp_dir: Path) -> Generator[Path, None, None]:
     with open(config_path, "w", encoding="utf-8") as f:
         json.dump(config_data, f)
 
-    yield config_path
+    return config_path
+
+
+@pytest.fixture
+def temp_config(temp_dir: Path) -> Generator[Path, None, None]:
+    """
+    Create a temporary config.json for testing.
+
+    Args:
+        temp_dir: Temporary directory fixture.
+
+    Yields:
+        Path to temporary config file.
+    """
+    yield _write_test_config(temp_dir)
+
+
+@pytest.fixture(scope="module")
+def module_config(tmp_path_factory):
+    """
+    Load a temporary config once for a whole test module.
+
+    For module-scoped objects that only read config while being
+    constructed. The config singleton is reset on teardown.
+
+    Yields:
+        Loaded Config instance.
+    """
+    from src.core import config_loader
+
+    config_path = _write_test_config(tmp_path_factory.mktemp("pdf_search_test_"))
+
+    config_loader._config_instance = None
+    yield config_loader.get_config(config_path)
+    config_loader._config_instance = None
 
 
 @pytest.fixture
@@ -287,6 +329,57 @@ def configured_db(temp_config, reset_config_singleton, reset_db_singleton):
     # Cleanup happens via reset fixtures
 
 
+@pytest.fixture(scope="session")
+def schema_template(tmp_path_factory) -> Path:
+    """
+    Build a database with the full schema once per test session.
+
+    Includes the sqlite-vec index when the extension can be loaded.
+
+    Returns:
+        Path to a self-contained template database file.
+    """
+    from src.core import config_loader
+    from src.database import connection, schema
+
+    root = tmp_path_factory.mktemp("schema_template")
+    config_path = _write_test_config(root)
+
+    config_loader._config_instance = None
+    connection._db_manager = None
+    try:
+        config = config_loader.get_config(config_path)
+        schema.init_schema()
+        schema.init_vector_index()
+    finally:
+        config_loader._config_instance = None
+        connection._db_manager = None
+        schema.reset_vec_extension_cache()
+
+    # Backup API folds any WAL content into a single standalone file
+    template_path = root / "schema.db"
+    with closing(sqlite3.connect(config.paths.database_path)) as source, \
+            closing(sqlite3.connect(template_path)) as template:
+        source.backup(template)
+
+    return template_path
+
+
+@pytest.fixture
+def schema_db(configured_db, schema_template):
+    """
+    Configured temp database that already has the schema.
+
+    Copies the session template into this test's database path instead
+    of running init_schema() and init_vector_index(), so FTS5, trigger
+    and vec0 DDL run once per session. Each test still gets its own
+    file, with fresh AUTOINCREMENT sequences.
+    """
+    from src.core.config_loader import get_config
+    shutil.copyfile(schema_template, get_config().paths.database_path)
+    yield
+
+
 @pytest.fixture
 def reset_embedding_singleton():
     """
@@ -326,19 +419,15 @@ def mock_embedding_response():
             dimensions: Embedding dimensions.
 
         Returns:
-            Mock response object.
+            Response object whose data items expose an embedding vector.
         """
-        mock_data = []
-        for i, text in enumerate(texts):
-            mock_item = Mock()
-            # Generate deterministic embeddings based on text content
-            np.random.seed(hash(text) % (2**32))
-            mock_item.embedding = np.random.randn(dimensions).tolist()
-            mock_data.append(mock_item)
-
-        mock_response = Mock()
-        mock_response.data = mock_data
-        return mock_response
+        # Deterministic embeddings: each text maps to a fixed pool row
+        rows = [zlib.crc32(text.encode("utf-8")) % len(_EMBEDDING_POOL) for text in texts]
+
+        return SimpleNamespace(data=[
+            SimpleNamespace(embedding=_EMBEDDING_POOL[row, :dimensions])
+            for row in rows
+        ])
 
     return _create_response
 
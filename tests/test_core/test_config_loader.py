@@ -164,6 +164,14 @@ class TestSemanticConfig:
         assert config.semantic.max_chunk_chars == 1800
         assert config.semantic.chunk_overlap_chars == 200
         assert config.semantic.embedding_batch_size == 32
+        assert config.semantic.max_parallel_requests == 4
+
+    def test_query_cache_defaults(self, temp_config: Path, reset_config_singleton):
+        """Test that query cache settings fall back to defaults."""
+        config = Config.from_file(temp_config)
+
+        assert config.semantic.query_cache_size == 0
+        assert config.semantic.query_cache_ttl_seconds == 300
 
 
 class TestHybridConfig:
@@ -12,14 +12,12 @@ SAFETY NOTE: All tests use the `configured_db` fixture which:
 
 import pytest
 
-from src.database.schema import init_schema
 from src.database.repository import DocumentRepository
 
 
 @pytest.fixture
-def repository(configured_db) -> DocumentRepository:
+def repository(schema_db) -> DocumentRepository:
     """Create a repository with initialized schema in temp database."""
-    init_schema()
     return DocumentRepository()
 
 
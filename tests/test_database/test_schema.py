@@ -13,6 +13,7 @@ SAFETY NOTE: All tests use the `configured_db` fixture which:
 from src.database.schema import (
     init_schema,
     reset_schema,
+    optimize_fts_index,
     get_statistics,
     init_vector_index,
     is_vec_extension_available,
@@ -109,6 +110,37 @@ class TestResetSchema:
             """, ("/new.pdf", "new.pdf", "new.pdf", "def456", 1, "New content"))
 
 
+class TestOptimizeFtsIndex:
+    """Tests for FTS5 index optimization."""
+
+    def test_optimize_keeps_matches(self, configured_db):
+        """Test that optimizing after several inserts keeps search results."""
+        init_schema()
+
+        for i in range(3):
+            with get_cursor() as cursor:
+                cursor.execute("""
+                    INSERT INTO documents (filepath, filename, relative_path, file_hash,
+                                           page_num, content)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (f"/doc{i}.pdf", f"doc{i}.pdf", f"doc{i}.pdf", "abc", 1, "Aviation civile"))
+
+        optimize_fts_index()
+
+        with get_connection() as conn:
+            result = conn.execute(
+                "SELECT COUNT(*) as cnt FROM documents_fts WHERE documents_fts MATCH ?",
+                ("aviation",)
+            ).fetchone()
+            assert result["cnt"] == 3
+
+    def test_optimize_empty_index(self, configured_db):
+        """Test that optimizing an empty index succeeds."""
+        init_schema()
+
+        optimize_fts_index()
+
+
 class TestGetStatistics:
     """Tests for statistics retrieval (read-only operations)."""
 
@@ -150,6 +182,89 @@ class TestGetStatistics:
         assert stats["total_pages"] == 3
         assert stats["total_files"] == 2
 
+    def test_stats_table_tracks_changes(self, configured_db):
+        """Test that documents_stats follows inserts, updates and deletes."""
+        init_schema()
+
+        with get_cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO documents (filepath, filename, page_num, content)
+                VALUES (?, ?, ?, ?)
+            """, ("/a.pdf", "a.pdf", 1, "abcd"))
+            cursor.execute("""
+                INSERT INTO documents (filepath, filename, page_num, content)
+                VALUES (?, ?, ?, ?)
+            """, ("/b.pdf", "b.pdf", 1, "abcdef"))
+            cursor.execute(
+                "UPDATE documents SET content = ? WHERE filepath = ?",
+                ("ab", "/a.pdf")
+            )
+            cursor.execute("DELETE FROM documents WHERE filepath = ?", ("/b.pdf",))
+
+        with get_connection() as conn:
+            row = conn.execute("SELECT n, sum_len FROM documents_stats").fetchone()
+            expected = conn.execute(
+                "SELECT COUNT(*) as n, SUM(LENGTH(content)) as sum_len FROM documents"
+            ).fetchone()
+
+        assert (row["n"], row["sum_len"]) == (1, 2)
+        assert (row["n"], row["sum_len"]) == (expected["n"], expected["sum_len"])
+
+    def test_stats_version_bumped_on_every_write(self, configured_db):
+        """Test that the version counter changes even when totals do not."""
+        init_schema()
+
+        def version():
+            with get_connection() as conn:
+                return conn.execute(
+                    "SELECT version FROM documents_stats WHERE id = 1"
+                ).fetchone()["version"]
+
+        with get_cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO documents (filepath, filename, page_num, content)
+                VALUES (?, ?, ?, ?)
+            """, ("/a.pdf", "a.pdf", 1, "abcd"))
+        after_insert = version()
+
+        # Same length content leaves n and sum_len unchanged
+        with get_cursor() as cursor:
+            cursor.execute(
+                "UPDATE documents SET content = ? WHERE filepath = ?",
+                ("wxyz", "/a.pdf")
+            )
+        after_update = version()
+
+        with get_cursor() as cursor:
+            cursor.execute("DELETE FROM documents WHERE filepath = ?", ("/a.pdf",))
+
+        assert after_insert == 1
+        assert after_update == 2
+        assert version() == 3
+
+    def test_stats_version_bumped_by_chunk_writes(self, configured_db):
+        """Test that semantic reindexing changes the version counter."""
+        init_schema()
+
+        with get_cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO documents (filepath, filename, page_num, content)
+                VALUES (?, ?, ?, ?)
+            """, ("/a.pdf", "a.pdf", 1, "abcd"))
+            cursor.execute("""
+                INSERT INTO chunks_metadata
+                    (chunk_id, document_id, page_num, position, content, char_count)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """, ("c1", cursor.lastrowid, 1, 0, "abcd", 4))
+            cursor.execute("DELETE FROM chunks_metadata WHERE chunk_id = ?", ("c1",))
+
+        with get_connection() as conn:
+            row = conn.execute(
+                "SELECT version FROM documents_stats WHERE id = 1"
+            ).fetchone()
+
+        assert row["version"] == 3
+
 
 class TestSemanticTables:
     """Tests for semantic search tables.
@@ -14,25 +14,26 @@ SAFETY NOTE: All tests use the `configured_db` fixture which:
 import pytest
 import numpy as np
 
-from src.database.schema import init_schema, init_vector_index
-from src.database.vector_repository import VectorRepository, VectorSearchResult
+from src.database.vector_repository import (
+    VectorRepository,
+    VectorSearchResult,
+    normalize_rows,
+)
 from src.extraction.semantic_chunker import SemanticChunk
 
 
 @pytest.fixture
-def vector_repo(configured_db, reset_vec_extension_cache):
+def vector_repo(schema_db, reset_vec_extension_cache):
     """
     Create a VectorRepository with initialized schema.
 
     Args:
-        configured_db: Database configuration fixture.
+        schema_db: Temp database with schema fixture.
         reset_vec_extension_cache: Vec extension cache reset fixture.
 
     Returns:
         VectorRepository instance.
     """
-    init_schema()
-    init_vector_index()
     return VectorRepository()
 
 
@@ -269,3 +270,83 @@ class TestVectorRepositorySearch:
             assert result.page_num > 0
             assert result.content is not None
             assert 0.0 < result.similarity <= 1.0
+
+    def test_search_with_normalized_query(self, populated_vector_repo, sample_embeddings):
+        """Test that a pre-normalized query gives the same results."""
+        query_embedding = sample_embeddings[0] * 5.0
+
+        raw = populated_vector_repo.search_similar(query_embedding, limit=3)
+        prepared = populated_vector_repo.search_similar(
+            normalize_rows(query_embedding), limit=3, normalized=True
+        )
+
+        assert [r.chunk_id for r in prepared] == [r.chunk_id for r in raw]
+        assert [r.similarity for r in prepared] == pytest.approx(
+            [r.similarity for r in raw]
+        )
+
+    def test_search_with_int8_embeddings(self, vector_repo, sample_chunks):
+        """Test that int8 quantized embeddings are stored and searched as float32."""
+        rng = np.random.default_rng(0)
+        quantized = rng.integers(-127, 128, (len(sample_chunks), 1024)).astype(np.int8)
+        vector_repo.store_chunks_batch(sample_chunks, quantized)
+
+        results = vector_repo.search_similar(quantized[1], limit=1)
+        if not results:
+            pytest.skip("sqlite-vec extension could not be loaded")
+
+        assert [r.chunk_id for r in results] == [sample_chunks[1].chunk_id]
+        assert results[0].similarity == pytest.approx(1.0, abs=1e-3)
+
+
+class TestVectorRepositoryNormalization:
+    """Tests for embedding normalization."""
+
+    def test_normalize_rows_unit_length(self, sample_embeddings):
+        """Test that each row is scaled to unit length as float32."""
+        normalized = normalize_rows(sample_embeddings * 3.0)
+
+        assert normalized.dtype == np.float32
+        assert normalized.flags.c_contiguous
+        np.testing.assert_allclose(
+            np.linalg.norm(normalized, axis=1), 1.0, rtol=1e-5
+        )
+
+    def test_normalize_single_vector_matches_rows(self, sample_embeddings):
+        """Test that a single vector is scaled exactly like a matrix row."""
+        single = normalize_rows(sample_embeddings[1])
+        rows = normalize_rows(sample_embeddings)
+
+        np.testing.assert_allclose(single, rows[1], rtol=1e-6)
+        assert np.linalg.norm(single) == pytest.approx(1.0, rel=1e-5)
+
+    def test_normalize_rows_keeps_zero_row(self, sample_embeddings):
+        """Test that a zero row in a matrix is left unchanged."""
+        matrix = sample_embeddings.copy()
+        matrix[2] = 0.0
+
+        normalized = normalize_rows(matrix)
+
+        assert not np.any(normalized[2])
+        assert np.linalg.norm(normalized[0]) == pytest.approx(1.0, rel=1e-5)
+
+    def test_normalize_rows_keeps_zero_vector(self):
+        """Test that zero vectors are left unchanged."""
+        normalized = normalize_rows(np.zeros(1024))
+
+        assert not np.any(normalized)
+
+    def test_stored_embeddings_normalized(
+        self, vector_repo, sample_chunks, sample_embeddings
+    ):
+        """Test that stored embeddings are unit length."""
+        from src.database.connection import get_connection
+
+        vector_repo.store_chunks_batch(sample_chunks, sample_embeddings)
+
+        with get_connection() as conn:
+            rows = conn.execute("SELECT embedding FROM chunks_vec").fetchall()
+
+        for row in rows:
+            stored = vector_repo._blob_to_array(row["embedding"])
+            assert np.linalg.norm(stored) == pytest.approx(1.0, rel=1e-5)
@@ -17,7 +17,7 @@ import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 from typing import List, Tuple
 
-from src.database.schema import init_schema, init_vector_index, reset_vec_extension_cache
+from src.database.schema import reset_vec_extension_cache
 from src.database.repository import DocumentRepository
 from src.database.vector_repository import VectorRepository
 from src.indexer.semantic_indexer import (
@@ -65,7 +65,7 @@ class TestSemanticIndexer:
     @pytest.fixture
     def mock_indexer(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
@@ -73,16 +73,13 @@ class TestSemanticIndexer:
         Create a SemanticIndexer with mocked embedding service.
 
         Args:
-            configured_db: Database configuration fixture.
+            schema_db: Temp database with schema fixture.
             reset_embedding_singleton: Singleton reset fixture.
             reset_vec_extension_cache: Vec extension cache reset fixture.
 
         Returns:
             SemanticIndexer with mocked dependencies.
         """
-        init_schema()
-        init_vector_index()
-
         # Create mock embedding service
         mock_embed_service = Mock()
         mock_embed_service.embed_passages.return_value = np.random.randn(1, 1024)
@@ -107,13 +104,11 @@ class TestSemanticIndexer:
 
     def test_indexer_disabled_by_param(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
         """Test creating disabled indexer via parameter."""
-        init_schema()
-
         with patch("src.indexer.semantic_indexer.get_embedding_service"):
             indexer = SemanticIndexer(enabled=False)
 
@@ -140,14 +135,11 @@ class TestSemanticIndexerIndexDocument:
     @pytest.fixture
     def indexer_with_mock(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
         """Create indexer with controllable mock."""
-        init_schema()
-        init_vector_index()
-
         mock_embed_service = Mock()
 
         def mock_embed(texts):
@@ -214,13 +206,11 @@ class TestSemanticIndexerIndexDocument:
 
     def test_index_document_disabled(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
         """Test that disabled indexer returns zero."""
-        init_schema()
-
         with patch("src.indexer.semantic_indexer.get_embedding_service"):
             indexer = SemanticIndexer(enabled=False)
 
@@ -236,14 +226,11 @@ class TestSemanticIndexerBatch:
     @pytest.fixture
     def batch_indexer(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
         """Create indexer for batch testing."""
-        init_schema()
-        init_vector_index()
-
         mock_embed_service = Mock()
 
         def mock_embed(texts):
@@ -304,13 +291,11 @@ class TestSemanticIndexerBatch:
 
     def test_index_documents_batch_disabled(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
         """Test that disabled indexer returns empty stats."""
-        init_schema()
-
         with patch("src.indexer.semantic_indexer.get_embedding_service"):
             indexer = SemanticIndexer(enabled=False)
 
@@ -329,14 +314,11 @@ class TestSemanticIndexerDelete:
     @pytest.fixture
     def populated_indexer(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
         """Create indexer with indexed documents."""
-        init_schema()
-        init_vector_index()
-
         mock_embed_service = Mock()
 
         def mock_embed(texts):
@@ -384,14 +366,11 @@ class TestSemanticIndexerReindex:
     @pytest.fixture
     def reindex_setup(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
         """Set up database with documents for reindexing."""
-        init_schema()
-        init_vector_index()
-
         # Insert documents into FTS5 index
         repo = DocumentRepository()
         repo.insert(
@@ -438,13 +417,11 @@ class TestSemanticIndexerReindex:
 
     def test_reindex_all_disabled(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
         """Test that disabled indexer returns empty stats on reindex."""
-        init_schema()
-
         with patch("src.indexer.semantic_indexer.get_embedding_service"):
             indexer = SemanticIndexer(enabled=False)
 
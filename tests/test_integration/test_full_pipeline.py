@@ -12,7 +12,7 @@ SAFETY NOTE: All tests use the `configured_db` fixture which:
 
 import pytest
 
-from src.database.schema import init_schema, get_statistics
+from src.database.schema import get_statistics
 from src.database.repository import DocumentRepository
 from src.search.bm25_engine import BM25Engine
 from src.search.models import SearchQuery
@@ -30,14 +30,13 @@ class TestFullPipeline:
     """
 
     @pytest.fixture
-    def integrated_system(self, configured_db):
+    def integrated_system(self, schema_db):
         """
         Set up an integrated system with indexed documents in temp DB.
 
         Creates a database with pre-indexed test documents
         for search testing.
         """
-        init_schema()
         repo = DocumentRepository()
 
         # Index a collection of test documents
@@ -227,9 +226,8 @@ class TestFullPipeline:
 class TestDatabaseIntegrity:
     """Tests for database integrity and consistency."""
 
-    def test_duplicate_prevention(self, configured_db):
+    def test_duplicate_prevention(self, schema_db):
         """Test that duplicate documents are handled in temp DB."""
-        init_schema()
         repo = DocumentRepository()
 
         # Insert document
@@ -263,9 +261,8 @@ class TestDatabaseIntegrity:
 
         assert stats.total_results >= 1
 
-    def test_statistics_update_on_changes(self, configured_db):
+    def test_statistics_update_on_changes(self, schema_db):
         """Test that statistics update when data changes in temp DB."""
-        init_schema()
         repo = DocumentRepository()
 
         # Initial stats
@@ -292,9 +289,8 @@ class TestSearchQuality:
     """Tests for search result quality."""
 
     @pytest.fixture
-    def ranked_documents(self, configured_db):
+    def ranked_documents(self, schema_db):
         """Create documents with varying relevance in temp DB."""
-        init_schema()
         repo = DocumentRepository()
 
         # Document with high relevance (multiple mentions)
@@ -12,16 +12,15 @@ SAFETY NOTE: All tests use the `configured_db` fixture which:
 
 import pytest
 
-from src.database.schema import init_schema
+from src.database.connection import get_connection, get_cursor
 from src.database.repository import DocumentRepository
 from src.search.bm25_engine import BM25Engine
 from src.search.models import SearchQuery
 
 
 @pytest.fixture
-def populated_database(configured_db):
+def populated_database(schema_db):
     """Create a database with test documents in temp DB."""
-    init_schema()
     repo = DocumentRepository()
 
     # Insert test documents
@@ -33,15 +32,11 @@ def populated_database(configured_db):
         ("Transport civil et infrastructure", "transport.pdf"),
     ]
 
-    for i, (content, filename) in enumerate(test_docs):
-        repo.insert(
-            filepath=f"/test/{filename}",
-            filename=filename,
-            relative_path=filename,
-            file_hash=f"hash{i}",
-            page_num=1,
-            content=content
-        )
+    # Single executemany transaction instead of one per document
+    repo.insert_batch([
+        (f"/test/{filename}", filename, 1, content, filename, f"hash{i}")
+        for i, (content, filename) in enumerate(test_docs)
+    ])
 
     return repo  # Return repo for potential further use
 
@@ -105,6 +100,16 @@ class TestBM25Engine:
             # Snippet should exist (may be empty for very short content)
             assert hasattr(result, "snippet")
 
+    def test_snippets_highlight_matches(self, populated_database):
+        """Test that snippets come from FTS5 with highlighted terms."""
+        engine = BM25Engine()
+        query = SearchQuery(text="maritime")
+
+        results, stats = engine.search(query)
+
+        assert len(results) == 1
+        assert "<mark>maritime</mark>" in results[0].snippet.lower()
+
     def test_search_results_have_scores(self, populated_database):
         """Test that results have relevance scores."""
         engine = BM25Engine()
@@ -155,6 +160,15 @@ class TestBM25EngineAdvancedSearch:
         for result in results:
             assert "militaire" not in result.filename.lower()
 
+    def test_leading_not_search(self, populated_database):
+        """Test that a leading NOT still excludes its operand."""
+        engine = BM25Engine()
+
+        query = SearchQuery(text="NOT militaire aviation", advanced=True)
+        results, stats = engine.search(query)
+
+        assert [r.filename for r in results] == ["aviation.pdf"]
+
     def test_phrase_search(self, populated_database):
         """Test quoted phrase search."""
         engine = BM25Engine()
@@ -192,3 +206,122 @@ class TestBM25EngineWithContent:
         # Content should be None when not included
         for result in results:
             assert result.content is None
+
+
+class TestBM25EngineBatchSearch:
+    """Tests for batched search execution."""
+
+    def test_batch_matches_individual_searches(self, populated_database):
+        """Test that batch results equal running each query separately."""
+        engine = BM25Engine()
+        queries = [
+            SearchQuery(text="aviation"),
+            SearchQuery(text="maritime"),
+            SearchQuery(text="aviation NOT militaire", advanced=True),
+        ]
+
+        batch = engine.search_batch(queries)
+
+        assert len(batch) == len(queries)
+        for query, (results, stats) in zip(queries, batch):
+            expected, expected_stats = engine.search(query)
+            assert [r.id for r in results] == [r.id for r in expected]
+            assert stats.query == query.text
+            assert stats.total_results == expected_stats.total_results
+
+    def test_batch_with_empty_query(self, populated_database):
+        """Test that empty queries yield empty results in place."""
+        engine = BM25Engine()
+        queries = [SearchQuery(text=""), SearchQuery(text="aviation")]
+
+        batch = engine.search_batch(queries)
+
+        assert batch[0][0] == []
+        assert batch[0][1].total_results == 0
+        assert len(batch[1][0]) > 0
+
+    def test_batch_empty_list(self, populated_database):
+        """Test that an empty batch returns an empty list."""
+        engine = BM25Engine()
+
+        assert engine.search_batch([]) == []
+
+
+class TestBM25EngineCountCache:
+    """Tests for the pagination count cache."""
+
+    def test_count_cached_across_pages(self, populated_database):
+        """Test that paging reuses the cached total count."""
+        engine = BM25Engine()
+
+        _, first = engine.search(SearchQuery(text="aviation", limit=1))
+        assert engine._count_cache == {"aviation": first.total_results}
+
+        _, second = engine.search(SearchQuery(text="aviation", limit=1, offset=1))
+        assert second.total_results == first.total_results
+
+    def test_count_cache_invalidated_on_insert(self, populated_database):
+        """Test that new documents invalidate cached counts."""
+        engine = BM25Engine()
+
+        _, before = engine.search(SearchQuery(text="aviation"))
+
+        populated_database.insert(
+            filepath="/test/nouveau.pdf",
+            filename="nouveau.pdf",
+            page_num=1,
+            content="Aviation générale"
+        )
+
+        _, after = engine.search(SearchQuery(text="aviation"))
+        assert after.total_results == before.total_results + 1
+
+    def test_count_cache_invalidated_on_same_length_update(self, populated_database):
+        """Test that rewriting content without changing its size drops counts."""
+        engine = BM25Engine()
+
+        _, before = engine.search(SearchQuery(text="maritime"))
+
+        # "Aviation" and "Maritime" have the same length
+        with get_cursor() as cursor:
+            cursor.execute(
+                "UPDATE documents SET content = ? WHERE filename = ?",
+                ("Maritime militaire et défense", "militaire.pdf")
+            )
+
+        _, after = engine.search(SearchQuery(text="maritime"))
+        assert after.total_results == before.total_results + 1
+
+    def test_count_cache_bounded(self, populated_database):
+        """Test that the least recently used count is evicted first."""
+        engine = BM25Engine()
+        engine.count_cache_size = 2
+
+        for text in ("aviation", "maritime", "aviation", "transport"):
+            engine.search(SearchQuery(text=text))
+
+        assert list(engine._count_cache) == ["aviation", "transport"]
+
+    def test_count_from_old_version_not_cached(self, populated_database):
+        """Test that a count read under a superseded version is not stored."""
+        engine = BM25Engine()
+
+        with get_connection() as conn:
+            token = engine._check_corpus_token(conn)
+            engine._corpus_token = token + 1  # another search saw a newer index
+
+            count = engine._count_results(conn, "aviation", token)
+
+        assert count == 2
+        assert engine._count_cache == {}
+
+    def test_missing_stats_row_disables_count_cache(self, populated_database):
+        """Test that searches work uncached when the version is unknown."""
+        with get_cursor() as cursor:
+            cursor.execute("DELETE FROM documents_stats")
+
+        engine = BM25Engine()
+        _, stats = engine.search(SearchQuery(text="aviation"))
+
+        assert stats.total_results == 2
+        assert engine._count_cache == {}
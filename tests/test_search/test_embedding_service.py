@@ -12,8 +12,11 @@ SAFETY NOTE: All tests use the `configured_db` fixture which:
 - Uses mocked API client to avoid external calls
 """
 
+import time
+
 import pytest
 import numpy as np
+from openai import APIError
 from unittest.mock import Mock, patch, MagicMock
 
 from src.search.embedding_service import (
@@ -21,6 +24,8 @@ from src.search.embedding_service import (
     get_embedding_service,
     RETRY_DELAY,
     MAX_RETRY_DELAY,
+    PASSAGE_PREFIX,
+    QUERY_PREFIX,
 )
 
 
@@ -45,6 +50,7 @@ class TestEmbeddingService:
         assert "endpoint" in info
         assert "initialized" in info
         assert info["dimensions"] == 1024
+        assert info["dtype"] == "float32"
 
     def test_get_embedding_service_singleton(
         self, configured_db, reset_embedding_singleton
@@ -55,6 +61,17 @@ class TestEmbeddingService:
 
         assert service1 is service2
 
+    def test_get_embedding_service_concurrent_singleton(
+        self, configured_db, reset_embedding_singleton
+    ):
+        """Test that concurrent first calls share one instance."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            services = list(executor.map(lambda _: get_embedding_service(), range(32)))
+
+        assert all(service is services[0] for service in services)
+
 
 class TestEmbeddingServiceWithMock:
     """Tests for EmbeddingService with mocked OpenAI client."""
@@ -101,12 +118,21 @@ class TestEmbeddingServiceWithMock:
         assert isinstance(embeddings, np.ndarray)
         assert embeddings.shape == (3, 1024)
 
+    def test_embed_passages_float32(self, mock_service):
+        """Test that passage embeddings are returned as float32."""
+        embeddings = mock_service.embed_passages(["First.", "Second."])
+
+        assert embeddings.dtype == np.float32
+        assert embeddings.flags.c_contiguous
+
     def test_embed_passages_empty(self, mock_service):
         """Test embedding empty list returns empty array."""
         embeddings = mock_service.embed_passages([])
 
         assert isinstance(embeddings, np.ndarray)
         assert len(embeddings) == 0
+        assert embeddings.shape == (0, 1024)
+        assert embeddings.dtype == np.float32
 
     def test_embed_query(self, mock_service):
         """Test embedding a search query."""
@@ -123,6 +149,19 @@ class TestEmbeddingServiceWithMock:
 
         assert isinstance(embedding, np.ndarray)
         assert len(embedding) == 0
+        assert embedding.dtype == np.float32
+
+    def test_empty_inputs_skip_client_init(
+        self, configured_db, reset_embedding_singleton
+    ):
+        """Test that empty inputs return without creating the client."""
+        service = EmbeddingService()
+
+        service.embed_query("")
+        service.embed_passages([])
+
+        assert service._client is None
+        assert service._initialized is False
 
     def test_embed_passages_adds_prefix(
         self, configured_db, reset_embedding_singleton, mock_embedding_response
@@ -146,6 +185,7 @@ class TestEmbeddingServiceWithMock:
 
         assert len(captured_inputs) == 1
         assert captured_inputs[0].startswith("passage: ")
+        assert captured_inputs[0] == PASSAGE_PREFIX + "Test passage"
 
     def test_embed_query_adds_prefix(
         self, configured_db, reset_embedding_singleton, mock_embedding_response
@@ -169,6 +209,7 @@ class TestEmbeddingServiceWithMock:
 
         assert len(captured_inputs) == 1
         assert captured_inputs[0].startswith("query: ")
+        assert captured_inputs[0] == QUERY_PREFIX + "Test query"
 
 
 class TestEmbeddingServiceBatching:
@@ -203,6 +244,65 @@ class TestEmbeddingServiceBatching:
         assert call_count >= 2
         assert embeddings.shape == (65, 1024)
 
+    def test_parallel_batches_keep_order(
+        self, configured_db, reset_embedding_singleton
+    ):
+        """Test that concurrently embedded batches land in input order."""
+        def indexed_create(model, input):
+            # Each vector is filled with the index parsed from its text
+            response = Mock()
+            response.data = [
+                Mock(embedding=[float(text.rsplit(" ", 1)[1])] * 1024)
+                for text in input
+            ]
+            return response
+
+        mock_client = Mock()
+        mock_client.embeddings = Mock()
+        mock_client.embeddings.create = indexed_create
+
+        service = EmbeddingService()
+        service._client = mock_client
+        service._initialized = True
+        service.config.semantic.max_parallel_requests = 4
+
+        embeddings = service.embed_passages([f"Text {i}" for i in range(100)])
+
+        np.testing.assert_array_equal(embeddings[:, 0], np.arange(100))
+
+    def test_failing_batch_stops_other_batches(
+        self, configured_db, reset_embedding_singleton
+    ):
+        """Test that one failed batch cancels retrying and queued batches."""
+        started = []
+
+        def failing_create(model, input):
+            batch = int(input[0].rsplit(" ", 1)[1]) // 32
+            started.append(batch)
+            if batch == 0:
+                raise ValueError("fatal batch error")
+            # Every other batch keeps retrying with a RETRY_DELAY wait
+            raise APIError("server unavailable", None, body=None)
+
+        mock_client = Mock()
+        mock_client.embeddings = Mock()
+        mock_client.embeddings.create = failing_create
+
+        service = EmbeddingService()
+        service._client = mock_client
+        service._initialized = True
+        service.config.semantic.max_parallel_requests = 2
+
+        start = time.monotonic()
+        with pytest.raises(ValueError, match="fatal batch error"):
+            service.embed_passages([f"Text {i}" for i in range(6 * 32)])
+
+        # The retry waits were cut short instead of lasting RETRY_DELAY
+        assert time.monotonic() - start < RETRY_DELAY / 2
+        # Two workers: batch 0, batch 1 and at most one follow-up started
+        assert len(started) <= 3
+        assert not {3, 4, 5} & set(started)
+
 
 class TestEmbeddingServiceSplitPoint:
     """Tests for text split point detection."""
@@ -2,29 +2,137 @@
 Tests for the hybrid search engine module.
 
 Tests unified search interface supporting lexical, semantic, and hybrid modes,
-including RRF fusion algorithm. Uses mocked sub-engines.
-
-SAFETY NOTE: All tests use the `configured_db` fixture which:
-- Creates a temporary directory via tempfile.mkdtemp()
-- Configures the database singleton to use a temp path
-- Cleans up all temp files after the test
-- Never touches real data directories
-- Uses mocked engines to avoid API calls
+including RRF fusion algorithm. Uses stub sub-engines.
+
+SAFETY NOTE: All engine tests share the module-scoped `hybrid_engine`
+fixture which:
+- Loads config from a temporary directory via `module_config`
+- Builds one HybridEngine with both sub-engines replaced by stubs
+- Never touches a database or real data directories
+- Uses stub engines to avoid API calls
 """
 
-import pytest
-from unittest.mock import Mock, patch, MagicMock
+import threading
+from contextlib import ExitStack
 from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import patch
+
+import numpy as np
+import pytest
 
-from src.database.schema import init_schema
-from src.database.repository import DocumentRepository
 from src.search.hybrid_engine import (
     HybridEngine,
     HybridSearchResult,
     HybridSearchStats,
     SearchMode,
 )
-from src.search.models import SearchResult
+
+
+@dataclass(frozen=True)
+class _FakeBM25Row:
+    """Lexical result row with the SearchResult fields HybridEngine reads."""
+    id: int
+    filepath: str
+    filename: str
+    page_num: int
+    relative_path: str
+    snippet: str
+    score: float
+    display_score: float
+    content: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _FakeSemanticRow:
+    """Semantic result row with the fields HybridEngine reads."""
+    document_id: int
+    filepath: str
+    filename: str
+    page_num: int
+    relative_path: str
+    snippet: str
+    similarity: float
+
+
+class _StubEngine:
+    """
+    Sub-engine test double exposing only search().
+
+    Returns a preset result, or applies side_effect like Mock does:
+    an exception is raised, a callable is called with the arguments.
+    Every call's arguments are recorded in calls.
+    """
+
+    __slots__ = ("result", "side_effect", "calls")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, results=(), side_effect=None):
+        """Bind fresh results and clear recorded calls."""
+        self.result = (list(results), SimpleNamespace(total_results=len(results)))
+        self.side_effect = side_effect
+        self.calls = []
+
+    def search(self, *args, **kwargs):
+        """Record the call and return the preset result."""
+        self.calls.append((args, kwargs))
+
+        if isinstance(self.side_effect, BaseException):
+            raise self.side_effect
+        if self.side_effect is not None:
+            return self.side_effect(*args, **kwargs)
+
+        return self.result
+
+
+@pytest.fixture(scope="module")
+def hybrid_engine(module_config):
+    """
+    Build one HybridEngine with stub sub-engines for the whole module.
+
+    The engine only reads config while being constructed and holds no
+    per-search state, so tests share it and only rebind the stubs
+    through set_engine_results.
+
+    Args:
+        module_config: Module-scoped temp config fixture.
+
+    Returns:
+        HybridEngine whose bm25_engine and semantic_engine are _StubEngine.
+    """
+    with ExitStack() as stack:
+        stack.enter_context(patch("src.search.hybrid_engine.BM25Engine", _StubEngine))
+        stack.enter_context(patch("src.search.hybrid_engine.SemanticEngine", _StubEngine))
+        engine = HybridEngine()
+
+    return engine
+
+
+def set_engine_results(
+    engine,
+    bm25_results=(),
+    semantic_results=(),
+    semantic_error=None
+):
+    """
+    Reset the shared engine's stubs and bind fresh search results.
+
+    Args:
+        engine: Shared HybridEngine from the hybrid_engine fixture.
+        bm25_results: Rows returned by the lexical engine.
+        semantic_results: Rows returned by the semantic engine.
+        semantic_error: If set, raised by the semantic engine instead.
+
+    Returns:
+        The same engine, ready for a test.
+    """
+    engine.bm25_engine.reset(bm25_results)
+    engine.semantic_engine.reset(semantic_results, side_effect=semantic_error)
+
+    return engine
 
 
 class TestSearchMode:
@@ -126,43 +234,17 @@ class TestHybridEngine:
     """Tests for HybridEngine class."""
 
     @pytest.fixture
-    def mock_hybrid_engine(
-        self,
-        configured_db,
-        reset_embedding_singleton,
-        reset_vec_extension_cache
-    ):
+    def mock_hybrid_engine(self, hybrid_engine):
         """
-        Create a HybridEngine with mocked sub-engines.
+        Create a HybridEngine with stub sub-engines.
 
         Args:
-            configured_db: Database configuration fixture.
-            reset_embedding_singleton: Singleton reset fixture.
-            reset_vec_extension_cache: Vec extension cache reset fixture.
+            hybrid_engine: Shared module-scoped engine fixture.
 
         Returns:
-            HybridEngine with mocked dependencies.
+            Shared HybridEngine with empty stub results.
         """
-        init_schema()
-
-        # Create mock BM25 engine
-        mock_bm25 = Mock()
-        mock_bm25.search.return_value = ([], Mock(total_results=0))
-
-        # Create mock Semantic engine
-        mock_semantic = Mock()
-        mock_semantic.search.return_value = ([], Mock(total_results=0))
-
-        with patch("src.search.hybrid_engine.BM25Engine") as MockBM25, \
-             patch("src.search.hybrid_engine.SemanticEngine") as MockSemantic:
-            MockBM25.return_value = mock_bm25
-            MockSemantic.return_value = mock_semantic
-
-            engine = HybridEngine()
-            engine.bm25_engine = mock_bm25
-            engine.semantic_engine = mock_semantic
-
-        return engine
+        return set_engine_results(hybrid_engine)
 
     def test_engine_creation(self, mock_hybrid_engine):
         """Test creating a HybridEngine instance."""
@@ -189,28 +271,19 @@ class TestHybridEngineModes:
     """Tests for different search modes."""
 
     @pytest.fixture
-    def engine_with_mock_results(
-        self,
-        configured_db,
-        reset_embedding_singleton,
-        reset_vec_extension_cache
-    ):
+    def engine_with_mock_results(self, hybrid_engine):
         """
         Create engine with mock results from both sub-engines.
 
         Args:
-            configured_db: Database configuration fixture.
-            reset_embedding_singleton: Singleton reset fixture.
-            reset_vec_extension_cache: Vec extension cache reset fixture.
+            hybrid_engine: Shared module-scoped engine fixture.
 
         Returns:
-            HybridEngine with mocked results.
+            HybridEngine with preset stub results.
         """
-        init_schema()
-
-        # Create mock BM25 results
+        # Fake BM25 result rows
         mock_bm25_results = [
-            Mock(
+            _FakeBM25Row(
                 id=1,
                 filepath="/test/doc1.pdf",
                 filename="doc1.pdf",
@@ -221,7 +294,7 @@ class TestHybridEngineModes:
                 display_score=0.95,
                 content="Content 1"
             ),
-            Mock(
+            _FakeBM25Row(
                 id=2,
                 filepath="/test/doc2.pdf",
                 filename="doc2.pdf",
@@ -233,14 +306,10 @@ class TestHybridEngineModes:
                 content="Content 2"
             ),
         ]
-        mock_bm25_stats = Mock(total_results=2)
-
-        mock_bm25 = Mock()
-        mock_bm25.search.return_value = (mock_bm25_results, mock_bm25_stats)
 
-        # Create mock Semantic results
+        # Fake semantic result rows
         mock_semantic_results = [
-            Mock(
+            _FakeSemanticRow(
                 document_id=2,
                 filepath="/test/doc2.pdf",
                 filename="doc2.pdf",
@@ -249,7 +318,7 @@ class TestHybridEngineModes:
                 snippet="Semantic result 1",
                 similarity=0.92
             ),
-            Mock(
+            _FakeSemanticRow(
                 document_id=3,
                 filepath="/test/doc3.pdf",
                 filename="doc3.pdf",
@@ -259,92 +328,50 @@ class TestHybridEngineModes:
                 similarity=0.88
             ),
         ]
-        mock_semantic_stats = Mock(total_results=2)
-
-        mock_semantic = Mock()
-        mock_semantic.search.return_value = (mock_semantic_results, mock_semantic_stats)
-
-        with patch("src.search.hybrid_engine.BM25Engine") as MockBM25, \
-             patch("src.search.hybrid_engine.SemanticEngine") as MockSemantic:
-            MockBM25.return_value = mock_bm25
-            MockSemantic.return_value = mock_semantic
-
-            engine = HybridEngine()
-            engine.bm25_engine = mock_bm25
-            engine.semantic_engine = mock_semantic
-
-        return engine
-
-    def test_lexical_mode_only_calls_bm25(self, engine_with_mock_results):
-        """Test lexical mode only uses BM25 engine."""
-        results, stats = engine_with_mock_results.search(
-            "aviation",
-            mode=SearchMode.LEXICAL
-        )
-
-        engine_with_mock_results.bm25_engine.search.assert_called_once()
-        engine_with_mock_results.semantic_engine.search.assert_not_called()
-        assert stats.mode == "lexical"
-
-    def test_semantic_mode_only_calls_semantic(self, engine_with_mock_results):
-        """Test semantic mode only uses semantic engine."""
-        results, stats = engine_with_mock_results.search(
-            "aviation",
-            mode=SearchMode.SEMANTIC
-        )
-
-        engine_with_mock_results.semantic_engine.search.assert_called_once()
-        engine_with_mock_results.bm25_engine.search.assert_not_called()
-        assert stats.mode == "semantic"
-
-    def test_hybrid_mode_calls_both(self, engine_with_mock_results):
-        """Test hybrid mode calls both engines."""
-        results, stats = engine_with_mock_results.search(
-            "aviation",
-            mode=SearchMode.HYBRID
-        )
 
-        engine_with_mock_results.bm25_engine.search.assert_called_once()
-        engine_with_mock_results.semantic_engine.search.assert_called_once()
-        assert stats.mode == "hybrid"
-
-    def test_lexical_results_have_source(self, engine_with_mock_results):
-        """Test lexical results are marked with correct source."""
-        results, stats = engine_with_mock_results.search(
-            "aviation",
-            mode=SearchMode.LEXICAL
+        return set_engine_results(
+            hybrid_engine,
+            bm25_results=mock_bm25_results,
+            semantic_results=mock_semantic_results
         )
 
-        for result in results:
-            assert result.source == "lexical"
+    @pytest.mark.parametrize(
+        ("mode", "expect_bm25", "expect_semantic", "source"),
+        [
+            (SearchMode.LEXICAL, True, False, "lexical"),
+            (SearchMode.SEMANTIC, False, True, "semantic"),
+            (SearchMode.HYBRID, True, True, None),
+        ],
+        ids=["lexical", "semantic", "hybrid"]
+    )
+    def test_mode_routing(
+        self,
+        engine_with_mock_results,
+        mode,
+        expect_bm25,
+        expect_semantic,
+        source
+    ):
+        """Test each mode calls only its engines and tags result sources."""
+        results, stats = engine_with_mock_results.search("aviation", mode=mode)
 
-    def test_semantic_results_have_source(self, engine_with_mock_results):
-        """Test semantic results are marked with correct source."""
-        results, stats = engine_with_mock_results.search(
-            "aviation",
-            mode=SearchMode.SEMANTIC
-        )
+        assert len(engine_with_mock_results.bm25_engine.calls) == int(expect_bm25)
+        assert len(engine_with_mock_results.semantic_engine.calls) == int(expect_semantic)
+        assert stats.mode == mode.value
 
-        for result in results:
-            assert result.source == "semantic"
+        if source is not None:
+            assert {r.source for r in results} <= {source}
 
 
 class TestRRFFusion:
     """Tests for Reciprocal Rank Fusion algorithm."""
 
     @pytest.fixture
-    def engine_for_fusion(
-        self,
-        configured_db,
-        reset_embedding_singleton,
-        reset_vec_extension_cache
-    ):
+    def engine_for_fusion(self, hybrid_engine):
         """Create engine for testing RRF fusion."""
-        init_schema()
-
         # Create overlapping results
         mock_bm25_results = [
-            Mock(
+            _FakeBM25Row(
                 id=1,
                 filepath="/test/common.pdf",
                 filename="common.pdf",
@@ -355,7 +382,7 @@ class TestRRFFusion:
                 display_score=0.95,
                 content="Content"
             ),
-            Mock(
+            _FakeBM25Row(
                 id=2,
                 filepath="/test/lexical_only.pdf",
                 filename="lexical_only.pdf",
@@ -369,7 +396,7 @@ class TestRRFFusion:
         ]
 
         mock_semantic_results = [
-            Mock(
+            _FakeSemanticRow(
                 document_id=1,
                 filepath="/test/common.pdf",
                 filename="common.pdf",
@@ -378,7 +405,7 @@ class TestRRFFusion:
                 snippet="Common doc - Semantic",
                 similarity=0.92
             ),
-            Mock(
+            _FakeSemanticRow(
                 document_id=3,
                 filepath="/test/semantic_only.pdf",
                 filename="semantic_only.pdf",
@@ -389,22 +416,11 @@ class TestRRFFusion:
             ),
         ]
 
-        mock_bm25 = Mock()
-        mock_bm25.search.return_value = (mock_bm25_results, Mock(total_results=2))
-
-        mock_semantic = Mock()
-        mock_semantic.search.return_value = (mock_semantic_results, Mock(total_results=2))
-
-        with patch("src.search.hybrid_engine.BM25Engine") as MockBM25, \
-             patch("src.search.hybrid_engine.SemanticEngine") as MockSemantic:
-            MockBM25.return_value = mock_bm25
-            MockSemantic.return_value = mock_semantic
-
-            engine = HybridEngine()
-            engine.bm25_engine = mock_bm25
-            engine.semantic_engine = mock_semantic
-
-        return engine
+        return set_engine_results(
+            hybrid_engine,
+            bm25_results=mock_bm25_results,
+            semantic_results=mock_semantic_results
+        )
 
     def test_fusion_detects_overlap(self, engine_for_fusion):
         """Test that RRF fusion detects overlapping results."""
@@ -422,8 +438,11 @@ class TestRRFFusion:
             mode=SearchMode.HYBRID
         )
 
-        sources = {r.filename: r.source for r in results}
-        assert sources.get("common.pdf") == "both"
+        assert {(r.filename, r.source) for r in results} >= {
+            ("common.pdf", "both"),
+            ("lexical_only.pdf", "lexical"),
+            ("semantic_only.pdf", "semantic"),
+        }
 
     def test_fusion_ranks_common_higher(self, engine_for_fusion):
         """Test that documents found by both methods rank higher."""
@@ -444,41 +463,47 @@ class TestRRFFusion:
             limit=10
         )
 
-        filenames = {r.filename for r in results}
-        assert "common.pdf" in filenames
-        assert "lexical_only.pdf" in filenames
-        assert "semantic_only.pdf" in filenames
+        assert {r.filename for r in results} >= {
+            "common.pdf", "lexical_only.pdf", "semantic_only.pdf"
+        }
 
+    def test_fusion_scores_and_tie_order(self, engine_for_fusion):
+        """Test RRF scores and that ties keep lexical-first order."""
+        results, stats = engine_for_fusion.search(
+            "aviation",
+            mode=SearchMode.HYBRID,
+            limit=10
+        )
 
-class TestHybridEngineWeights:
-    """Tests for configurable weights."""
+        k = engine_for_fusion.rrf_k
+        assert results[0].score == pytest.approx(2.0 / (k + 1))
+        assert results[0].lexical_rank == 1
+        assert results[0].semantic_rank == 1
+        assert results[0].similarity == pytest.approx(0.92)
 
-    @pytest.fixture
-    def engine_with_weights(
-        self,
-        configured_db,
-        reset_embedding_singleton,
-        reset_vec_extension_cache
-    ):
-        """Create engine for testing weight parameters."""
-        init_schema()
+        # Both single-source results sit at rank 2 and tie on score
+        assert [r.filename for r in results[1:]] == ["lexical_only.pdf", "semantic_only.pdf"]
+        assert results[1].similarity is None
+        assert results[2].lexical_rank is None
 
-        mock_bm25 = Mock()
-        mock_bm25.search.return_value = ([], Mock(total_results=0))
+    @pytest.mark.parametrize("limit", [0, 1, 3, 7, 20])
+    def test_partial_selection_order(self, limit):
+        """Test that top-k selection matches a full stable sort, ties included."""
+        scores = np.array([0.5, 0.9, 0.5, 0.1, 0.9, 0.5, 0.3, 0.5, 0.0, 0.7])
 
-        mock_semantic = Mock()
-        mock_semantic.search.return_value = ([], Mock(total_results=0))
+        top = HybridEngine._top_k_indices(scores, limit)
 
-        with patch("src.search.hybrid_engine.BM25Engine") as MockBM25, \
-             patch("src.search.hybrid_engine.SemanticEngine") as MockSemantic:
-            MockBM25.return_value = mock_bm25
-            MockSemantic.return_value = mock_semantic
+        expected = np.argsort(-scores, kind="stable")[:limit]
+        assert top.tolist() == expected.tolist()
 
-            engine = HybridEngine()
-            engine.bm25_engine = mock_bm25
-            engine.semantic_engine = mock_semantic
 
-        return engine
+class TestHybridEngineWeights:
+    """Tests for configurable weights."""
+
+    @pytest.fixture
+    def engine_with_weights(self, hybrid_engine):
+        """Create engine for testing weight parameters."""
+        return set_engine_results(hybrid_engine)
 
     def test_default_weights(self, engine_with_weights):
         """Test that default weights are applied."""
@@ -502,17 +527,10 @@ class TestHybridEngineErrorHandling:
     """Tests for error handling and graceful degradation."""
 
     @pytest.fixture
-    def engine_with_failing_semantic(
-        self,
-        configured_db,
-        reset_embedding_singleton,
-        reset_vec_extension_cache
-    ):
+    def engine_with_failing_semantic(self, hybrid_engine):
         """Create engine where semantic search fails."""
-        init_schema()
-
         mock_bm25_results = [
-            Mock(
+            _FakeBM25Row(
                 id=1,
                 filepath="/test/doc.pdf",
                 filename="doc.pdf",
@@ -525,22 +543,11 @@ class TestHybridEngineErrorHandling:
             ),
         ]
 
-        mock_bm25 = Mock()
-        mock_bm25.search.return_value = (mock_bm25_results, Mock(total_results=1))
-
-        mock_semantic = Mock()
-        mock_semantic.search.side_effect = Exception("API Error")
-
-        with patch("src.search.hybrid_engine.BM25Engine") as MockBM25, \
-             patch("src.search.hybrid_engine.SemanticEngine") as MockSemantic:
-            MockBM25.return_value = mock_bm25
-            MockSemantic.return_value = mock_semantic
-
-            engine = HybridEngine()
-            engine.bm25_engine = mock_bm25
-            engine.semantic_engine = mock_semantic
-
-        return engine
+        return set_engine_results(
+            hybrid_engine,
+            bm25_results=mock_bm25_results,
+            semantic_error=Exception("API Error")
+        )
 
     def test_hybrid_degrades_gracefully(self, engine_with_failing_semantic):
         """Test that hybrid mode returns lexical results if semantic fails."""
@@ -553,3 +560,47 @@ class TestHybridEngineErrorHandling:
         assert len(results) > 0
         assert len(stats.errors) > 0
         assert "Semantic" in stats.errors[0]
+
+
+class TestHybridEngineConcurrency:
+    """Tests for concurrent sub-engine execution in hybrid mode."""
+
+    def test_sub_engines_run_concurrently(self, hybrid_engine):
+        """Test that both engines are in flight at the same time."""
+        engine = set_engine_results(hybrid_engine)
+
+        # Each search blocks until the other has started; serial calls time out
+        barrier = threading.Barrier(2, timeout=5)
+
+        def lexical_search(search_query):
+            barrier.wait()
+            return [], SimpleNamespace(total_results=0)
+
+        def semantic_search(query, limit):
+            barrier.wait()
+            return [], SimpleNamespace(total_results=0)
+
+        engine.bm25_engine.side_effect = lexical_search
+        engine.semantic_engine.side_effect = semantic_search
+
+        results, stats = engine.search("aviation", mode=SearchMode.HYBRID)
+
+        assert stats.errors == []
+        assert len(engine.bm25_engine.calls) == 1
+        assert len(engine.semantic_engine.calls) == 1
+
+    def test_errors_recorded_in_engine_order(self, hybrid_engine):
+        """Test that both failures are reported, lexical first."""
+        engine = set_engine_results(
+            hybrid_engine,
+            semantic_error=Exception("API Error")
+        )
+        engine.bm25_engine.side_effect = Exception("DB Error")
+
+        results, stats = engine.search("aviation", mode=SearchMode.HYBRID)
+
+        assert results == []
+        assert stats.errors == [
+            "Lexical search error: DB Error",
+            "Semantic search error: API Error",
+        ]
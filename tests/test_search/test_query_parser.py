@@ -4,24 +4,28 @@ Tests for the FTS5 query parser.
 Tests query sanitization, operator handling, and term extraction.
 """
 
+import pytest
+
 from src.search.query_parser import QueryParser
 
 
+@pytest.fixture(scope="module")
+def parser():
+    """Share one QueryParser across the module; its parse cache is deterministic."""
+    return QueryParser()
+
+
 class TestQueryParserBasicMode:
     """Tests for basic (simple) query parsing."""
 
-    def test_simple_words(self):
+    def test_simple_words(self, parser):
         """Test parsing simple words."""
-        parser = QueryParser()
-
         result = parser.parse("aviation civile")
 
         assert result == "aviation civile"
 
-    def test_removes_special_characters(self):
+    def test_removes_special_characters(self, parser):
         """Test that FTS5 special characters are removed."""
-        parser = QueryParser()
-
         # Characters like *, -, +, :, ^, ', " should be removed
         result = parser.parse('test*query "phrase" term+')
 
@@ -29,26 +33,20 @@ class TestQueryParserBasicMode:
         assert '"' not in result
         assert "+" not in result
 
-    def test_normalizes_whitespace(self):
+    def test_normalizes_whitespace(self, parser):
         """Test that multiple spaces are normalized."""
-        parser = QueryParser()
-
         result = parser.parse("   multiple    spaces   here   ")
 
         assert "  " not in result
         assert result == "multiple spaces here"
 
-    def test_empty_string_returns_empty(self):
+    def test_empty_string_returns_empty(self, parser):
         """Test that empty input returns empty string."""
-        parser = QueryParser()
-
         assert parser.parse("") == ""
         assert parser.parse("   ") == ""
 
-    def test_preserves_accented_characters(self):
+    def test_preserves_accented_characters(self, parser):
         """Test that French accents are preserved."""
-        parser = QueryParser()
-
         result = parser.parse("règlement sécurité")
 
         assert "è" in result
@@ -58,118 +56,146 @@ class TestQueryParserBasicMode:
 class TestQueryParserAdvancedMode:
     """Tests for advanced query parsing with operators."""
 
-    def test_preserves_or_operator(self):
+    def test_preserves_or_operator(self, parser):
         """Test that OR operator is preserved."""
-        parser = QueryParser()
-
         result = parser.parse_advanced("aviation OR maritime")
 
         assert "OR" in result
 
-    def test_preserves_and_operator(self):
+    def test_preserves_and_operator(self, parser):
         """Test that AND operator is preserved."""
-        parser = QueryParser()
-
         result = parser.parse_advanced("aviation AND civile")
 
         assert "AND" in result
 
-    def test_preserves_not_operator(self):
+    def test_preserves_not_operator(self, parser):
         """Test that NOT operator is preserved."""
-        parser = QueryParser()
-
         result = parser.parse_advanced("aviation NOT militaire")
 
         assert "NOT" in result
 
-    def test_preserves_quoted_phrases(self):
+    def test_preserves_quoted_phrases(self, parser):
         """Test that quoted phrases are preserved."""
-        parser = QueryParser()
-
         result = parser.parse_advanced('"aviation civile"')
 
         assert '"aviation civile"' in result
 
-    def test_preserves_prefix_wildcard(self):
+    def test_preserves_prefix_wildcard(self, parser):
         """Test that prefix wildcards are preserved."""
-        parser = QueryParser()
-
         result = parser.parse_advanced("aéro*")
 
         assert "aéro*" in result or "aero*" in result
 
-    def test_case_insensitive_operators(self):
+    def test_case_insensitive_operators(self, parser):
         """Test that operators are case-insensitive."""
-        parser = QueryParser()
-
         result = parser.parse_advanced("word1 or word2 not word3")
 
         assert "OR" in result
         assert "NOT" in result
 
-    def test_complex_query(self):
+    def test_complex_query(self, parser):
         """Test complex query with multiple operators."""
-        parser = QueryParser()
-
         result = parser.parse_advanced('"sécurité aérienne" OR règlement NOT obsolète')
 
         assert '"sécurité aérienne"' in result
         assert "OR" in result
         assert "NOT" in result
 
+    def test_phrase_attached_to_word(self, parser):
+        """Test that a phrase glued to a word is split into separate tokens."""
+        result = parser.parse_advanced('règlement"aviation civile"')
+
+        assert result == 'règlement "aviation civile"'
+
+    def test_drops_trailing_operator(self, parser):
+        """Test that an operator without right operand is dropped."""
+        assert parser.parse_advanced("aviation OR") == "aviation"
+        assert parser.parse_advanced("aviation NOT") == "aviation"
+
+    def test_drops_operator_without_left_operand(self, parser):
+        """Test that a leading OR or AND is dropped."""
+        assert parser.parse_advanced("OR aviation") == "aviation"
+        assert parser.parse_advanced("aviation OR AND maritime") == "aviation OR maritime"
+
+    def test_leading_not_keeps_negated_term(self, parser):
+        """Test that a leading NOT still excludes its operand."""
+        assert parser.parse_advanced("NOT militaire aviation") == "aviation NOT militaire"
+        assert parser.parse_advanced(
+            "NOT militaire NOT maritime aviation civile"
+        ) == "aviation NOT militaire NOT maritime civile"
+
+    def test_or_not_is_not_rewritten(self, parser):
+        """Test that OR NOT keeps its meaning instead of becoming NOT."""
+        assert parser.parse_advanced("a OR NOT b") == "a OR NOT b"
+
+    def test_and_not_folded_into_not(self, parser):
+        """Test that AND NOT is written as FTS5's binary NOT."""
+        assert parser.parse_advanced("aviation AND NOT militaire") == "aviation NOT militaire"
+
+
+class TestQueryParserCache:
+    """Tests for the parsed query cache."""
+
+    def test_repeated_query_parsed_once(self):
+        """Test that parsing the same text again is served from the cache."""
+        parser = QueryParser()
+
+        first = parser.parse("aviation civile")
+        second = parser.parse("aviation civile")
+
+        assert first == second == "aviation civile"
+        assert parser._parse_cached.cache_info().hits == 1
+
+    def test_modes_cached_separately(self):
+        """Test that basic and advanced parses of one text do not share entries."""
+        parser = QueryParser()
+
+        assert parser.parse("aviation OR maritime") == "aviation OR maritime"
+        assert parser.parse_advanced('"aviation" OR maritime') == '"aviation" OR maritime'
+        assert parser.parse('"aviation" OR maritime') == "aviation OR maritime"
+        assert parser._parse_advanced_cached.cache_info().currsize == 1
+
 
 class TestQueryParserExtractTerms:
     """Tests for term extraction."""
 
-    def test_extracts_simple_terms(self):
+    def test_extracts_simple_terms(self, parser):
         """Test extracting terms from simple query."""
-        parser = QueryParser()
-
         terms = parser.extract_terms("aviation civile")
 
         assert "aviation" in terms
         assert "civile" in terms
 
-    def test_removes_operators(self):
+    def test_removes_operators(self, parser):
         """Test that operators are not included as terms."""
-        parser = QueryParser()
-
         terms = parser.extract_terms("aviation OR civile NOT militaire")
 
         assert "or" not in terms
         assert "and" not in terms
         assert "not" not in terms
 
-    def test_handles_quoted_phrases(self):
+    def test_handles_quoted_phrases(self, parser):
         """Test extracting terms from quoted phrases."""
-        parser = QueryParser()
-
         terms = parser.extract_terms('"aviation civile"')
 
         assert "aviation" in terms
         assert "civile" in terms
 
-    def test_removes_wildcards(self):
+    def test_removes_wildcards(self, parser):
         """Test that wildcards are stripped from terms."""
-        parser = QueryParser()
-
         terms = parser.extract_terms("aéro* test")
 
         # Should have "aéro" or "aero", not "aéro*"
         assert not any("*" in term for term in terms)
 
-    def test_returns_lowercase(self):
+    def test_returns_lowercase(self, parser):
         """Test that terms are lowercase."""
-        parser = QueryParser()
-
         terms = parser.extract_terms("Aviation CIVILE Test")
 
         assert all(term == term.lower() for term in terms)
 
-    def test_deduplicates_terms(self):
+    def test_deduplicates_terms(self, parser):
         """Test that duplicate terms are removed."""
-        parser = QueryParser()
-
         terms = parser.extract_terms("test test test")
 
         assert terms.count("test") == 1
@@ -12,11 +12,14 @@ SAFETY NOTE: All tests use the `configured_db` fixture which:
 - Uses mocked embedding service to avoid API calls
 """
 
+from types import SimpleNamespace
+
 import pytest
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
 
-from src.database.schema import init_schema, init_vector_index, reset_vec_extension_cache
+from src.database.connection import get_cursor
+from src.database.schema import reset_vec_extension_cache
 from src.database.repository import DocumentRepository
 from src.database.vector_repository import VectorRepository, VectorSearchResult
 from src.search.semantic_engine import (
@@ -25,6 +28,26 @@ from src.search.semantic_engine import (
     SemanticSearchStats,
 )
 
+# Query embedding returned by mocked services. The vector repository is
+# mocked too, so its values never matter; one read-only array is shared.
+_FAKE_EMBEDDING = np.zeros(1024, dtype=np.float32)
+_FAKE_EMBEDDING.flags.writeable = False
+
+_FAKE_MODEL_INFO = {
+    "model": "test-model",
+    "dimensions": 1024,
+    "endpoint": "https://test.example.com",
+    "initialized": True
+}
+
+
+def _make_fake_embed_service() -> SimpleNamespace:
+    """Plain embedding service stand-in for tests that never inspect its calls."""
+    return SimpleNamespace(
+        embed_query=lambda query: _FAKE_EMBEDDING,
+        get_model_info=lambda: dict(_FAKE_MODEL_INFO)
+    )
+
 
 class TestSemanticSearchResult:
     """Tests for SemanticSearchResult dataclass."""
@@ -76,7 +99,7 @@ class TestSemanticEngine:
     @pytest.fixture
     def mock_engine(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
@@ -84,28 +107,20 @@ class TestSemanticEngine:
         Create a SemanticEngine with mocked dependencies.
 
         Args:
-            configured_db: Database configuration fixture.
+            schema_db: Temp database with schema fixture.
             reset_embedding_singleton: Singleton reset fixture.
             reset_vec_extension_cache: Vec extension cache reset fixture.
 
         Returns:
             SemanticEngine with mocked dependencies.
         """
-        init_schema()
-        init_vector_index()
-
         # Create mocked embedding service
         mock_embed_service = Mock()
-        mock_embed_service.embed_query.return_value = np.random.randn(1024)
-        mock_embed_service.get_model_info.return_value = {
-            "model": "test-model",
-            "dimensions": 1024,
-            "endpoint": "https://test.example.com",
-            "initialized": True
-        }
+        mock_embed_service.embed_query.return_value = _FAKE_EMBEDDING
+        mock_embed_service.get_model_info.return_value = dict(_FAKE_MODEL_INFO)
 
         # Create mocked vector repository
-        mock_vector_repo = Mock()
+        mock_vector_repo = MagicMock()
         mock_vector_repo.get_chunk_count.return_value = 100
         mock_vector_repo.search_similar.return_value = []
 
@@ -118,21 +133,38 @@ class TestSemanticEngine:
 
         return engine
 
-    def test_engine_creation(self, mock_engine):
+    @pytest.fixture
+    def plain_engine(self, schema_db, reset_embedding_singleton):
+        """
+        Create a SemanticEngine whose services are plain stand-ins.
+
+        For tests that never assert on service calls; only the vector
+        repository's chunk count is provided.
+        """
+        with patch(
+            "src.search.semantic_engine.get_embedding_service",
+            _make_fake_embed_service
+        ):
+            engine = SemanticEngine()
+        engine.vector_repo = SimpleNamespace(get_chunk_count=lambda: 100)
+
+        return engine
+
+    def test_engine_creation(self, plain_engine):
         """Test creating a SemanticEngine instance."""
-        assert mock_engine is not None
+        assert plain_engine is not None
 
-    def test_search_empty_query(self, mock_engine):
+    def test_search_empty_query(self, plain_engine):
         """Test search with empty query returns empty results."""
-        results, stats = mock_engine.search("")
+        results, stats = plain_engine.search("")
 
         assert len(results) == 0
         assert stats.total_results == 0
         assert stats.execution_time_ms == 0
 
-    def test_search_whitespace_query(self, mock_engine):
+    def test_search_whitespace_query(self, plain_engine):
         """Test search with whitespace-only query returns empty results."""
-        results, stats = mock_engine.search("   ")
+        results, stats = plain_engine.search("   ")
 
         assert len(results) == 0
         assert stats.total_results == 0
@@ -149,6 +181,32 @@ class TestSemanticEngine:
 
         mock_engine.vector_repo.search_similar.assert_called_once()
 
+    def test_search_passes_normalized_query(self, mock_engine):
+        """Test that the query embedding is normalized once before search."""
+        mock_engine.embedding_service.embed_query.return_value = np.full(
+            1024, 3.0, dtype=np.float32
+        )
+
+        mock_engine.search("aviation safety")
+
+        args, kwargs = mock_engine.vector_repo.search_similar.call_args
+        assert kwargs["normalized"] is True
+        assert np.linalg.norm(args[0]) == pytest.approx(1.0, rel=1e-5)
+
+    @pytest.mark.parametrize("dtype", [np.float32, np.int8])
+    def test_search_accepts_quantized_query(self, mock_engine, dtype):
+        """Test that int8 query embeddings reach the index as float32 unit vectors."""
+        rng = np.random.default_rng(0)
+        mock_engine.embedding_service.embed_query.return_value = (
+            rng.integers(-127, 128, 1024).astype(dtype)
+        )
+
+        mock_engine.search("aviation safety")
+
+        args, _ = mock_engine.vector_repo.search_similar.call_args
+        assert args[0].dtype == np.float32
+        assert np.linalg.norm(args[0]) == pytest.approx(1.0, rel=1e-5)
+
     def test_search_returns_stats(self, mock_engine):
         """Test that search returns statistics."""
         results, stats = mock_engine.search("aviation")
@@ -158,23 +216,67 @@ class TestSemanticEngine:
         assert stats.embedding_time_ms >= 0
         assert stats.search_time_ms >= 0
 
-    def test_get_index_stats(self, mock_engine):
+    def test_get_index_stats(self, plain_engine):
         """Test getting index statistics."""
-        stats = mock_engine.get_index_stats()
+        stats = plain_engine.get_index_stats()
 
         assert "total_chunks" in stats
         assert "embedding_model" in stats
         assert "embedding_dimensions" in stats
         assert "index_ready" in stats
 
-    def test_clear_cache(self, mock_engine):
+    def test_clear_cache(self, plain_engine):
         """Test clearing document cache."""
         # Add something to cache
-        mock_engine._document_cache[1] = {"filepath": "/test"}
+        plain_engine._document_cache[1] = {"filepath": "/test"}
+
+        plain_engine.clear_cache()
+
+        assert len(plain_engine._document_cache) == 0
+
+    def test_cache_bounded_at_maxsize(self, plain_engine):
+        """Test that the document cache evicts the least recently used entry."""
+        repo = DocumentRepository()
+        doc_ids = [
+            repo.insert(filepath=f"/test/{name}.pdf", filename=f"{name}.pdf",
+                        page_num=1, content=name)
+            for name in ("a", "b", "c")
+        ]
+        plain_engine.document_cache_size = 2
+
+        for doc_id in (doc_ids[0], doc_ids[1], doc_ids[0], doc_ids[2]):
+            assert plain_engine._get_document_info(doc_id) is not None
+
+        assert list(plain_engine._document_cache) == [doc_ids[0], doc_ids[2]]
+
+    def test_enrich_single_query(self, plain_engine):
+        """Test that results from several documents are enriched with one query."""
+        from src.search import semantic_engine
+
+        repo = DocumentRepository()
+        doc_ids = [
+            repo.insert(filepath=f"/test/{name}.pdf", filename=f"{name}.pdf",
+                        page_num=1, content=name)
+            for name in ("a", "b", "c")
+        ]
+        vector_results = [
+            VectorSearchResult(
+                chunk_id=f"chunk{i}", document_id=doc_id, page_num=1,
+                position=0, content="Aviation", similarity=0.9
+            )
+            for i, doc_id in enumerate(doc_ids + [doc_ids[0], 99999])
+        ]
+
+        with patch.object(
+            semantic_engine, "get_connection", wraps=semantic_engine.get_connection
+        ) as connection_spy:
+            results = plain_engine._enrich_results(vector_results, 0.0)
+            assert connection_spy.call_count == 1
 
-        mock_engine.clear_cache()
+            plain_engine._enrich_results(vector_results, 0.0)
+            assert connection_spy.call_count == 2  # only the unknown id again
 
-        assert len(mock_engine._document_cache) == 0
+        assert [r.filename for r in results] == ["a.pdf", "b.pdf", "c.pdf", "a.pdf"]
 
 
 class TestSemanticEngineWithResults:
@@ -183,7 +285,7 @@ class TestSemanticEngineWithResults:
     @pytest.fixture
     def engine_with_results(
         self,
-        configured_db,
+        schema_db,
         reset_embedding_singleton,
         reset_vec_extension_cache
     ):
@@ -191,15 +293,13 @@ class TestSemanticEngineWithResults:
         Create a SemanticEngine with mocked results.
 
         Args:
-            configured_db: Database configuration fixture.
+            schema_db: Temp database with schema fixture.
             reset_embedding_singleton: Singleton reset fixture.
             reset_vec_extension_cache: Vec extension cache reset fixture.
 
         Returns:
             SemanticEngine configured to return mock results.
         """
-        init_schema()
-
         # Insert test documents into temp database
         repo = DocumentRepository()
         repo.insert(
@@ -217,15 +317,10 @@ class TestSemanticEngineWithResults:
 
         # Create mocked services
         mock_embed_service = Mock()
-        mock_embed_service.embed_query.return_value = np.random.randn(1024)
-        mock_embed_service.get_model_info.return_value = {
-            "model": "test-model",
-            "dimensions": 1024,
-            "endpoint": "https://test.example.com",
-            "initialized": True
-        }
-
-        mock_vector_repo = Mock()
+        mock_embed_service.embed_query.return_value = _FAKE_EMBEDDING
+        mock_embed_service.get_model_info.return_value = dict(_FAKE_MODEL_INFO)
+
+        mock_vector_repo = MagicMock()
         mock_vector_repo.get_chunk_count.return_value = 10
         mock_vector_repo.search_similar.return_value = [
             VectorSearchResult(
@@ -285,16 +380,138 @@ class TestSemanticEngineWithResults:
         for result in results:
             assert result.similarity >= 0.90
 
+    @pytest.mark.parametrize("min_similarity, expected", [
+        (0.0, ["chunk001", "chunk002"]),
+        (0.85, ["chunk001", "chunk002"]),
+        (0.86, ["chunk001"]),
+        (0.95, ["chunk001"]),
+        (0.99, []),
+    ])
+    def test_min_similarity_cut_point(self, engine_with_results, min_similarity, expected):
+        """Test that the threshold keeps results equal to it and drops lower ones."""
+        results, stats = engine_with_results.search("aviation", min_similarity=min_similarity)
+
+        assert [r.chunk_id for r in results] == expected
+        assert stats.total_results == len(expected)
+
+    @pytest.fixture
+    def caching_engine(self, engine_with_results):
+        """engine_with_results with the query cache enabled."""
+        engine_with_results.query_cache_size = 8
+        return engine_with_results
+
+    def test_query_cache_disabled_by_default(self, engine_with_results):
+        """Test that repeated queries are searched again when the cache is off."""
+        engine_with_results.search("aviation")
+        _, stats = engine_with_results.search("aviation")
+
+        assert not stats.cache_hit
+        assert engine_with_results.vector_repo.search_similar.call_count == 2
+        assert engine_with_results.cache_info()["size"] == 0
+
+    def test_exact_query_skips_embedding(self, caching_engine):
+        """Test that repeating a query is served without embedding it again."""
+        first, _ = caching_engine.search("aviation")
+        second, stats = caching_engine.search("aviation")
+
+        assert second == first
+        assert stats.cache_hit
+        assert stats.embedding_time_ms == 0
+        caching_engine.embedding_service.embed_query.assert_called_once()
+        caching_engine.vector_repo.search_similar.assert_called_once()
+        assert caching_engine.cache_info()["hits"] == 1
+        assert caching_engine.cache_info()["hit_rate"] == 0.5
+
+    def test_cached_results_are_copies(self, caching_engine):
+        """Test that editing returned results does not change the cache."""
+        first, _ = caching_engine.search("aviation")
+        first[0].snippet = "edited"
+
+        second, _ = caching_engine.search("aviation")
+        second[1].snippet = "edited too"
+
+        third, stats = caching_engine.search("aviation")
+        assert stats.cache_hit
+        assert third[0].snippet != "edited"
+        assert third[1].snippet != "edited too"
+
+    def test_similar_query_not_served_from_cache(self, caching_engine):
+        """Test that only the exact query text is matched."""
+        caching_engine.search("aviation safety")
+        _, stats = caching_engine.search("safety in aviation")
+
+        assert not stats.cache_hit
+        assert caching_engine.vector_repo.search_similar.call_count == 2
+
+    def test_semantic_cache_keyed_by_parameters(self, caching_engine):
+        """Test that a different limit or threshold is not served from cache."""
+        caching_engine.search("aviation")
+        _, other_limit = caching_engine.search("aviation", limit=5)
+        _, other_threshold = caching_engine.search("aviation", min_similarity=0.9)
+
+        assert not other_limit.cache_hit
+        assert not other_threshold.cache_hit
+        assert caching_engine.vector_repo.search_similar.call_count == 3
+
+    def test_semantic_cache_ttl(self, caching_engine):
+        """Test that expired entries are dropped instead of reused."""
+        caching_engine.search("aviation")
+        for entry in caching_engine._query_cache.values():
+            entry.created_at -= caching_engine.query_cache_ttl + 1
+
+        _, stats = caching_engine.search("aviation")
+
+        assert not stats.cache_hit
+        assert caching_engine.vector_repo.search_similar.call_count == 2
+        assert caching_engine.cache_info()["size"] == 1
+
+    def test_semantic_cache_bounded(self, caching_engine):
+        """Test that the least recently used query is evicted first."""
+        caching_engine.query_cache_size = 2
+
+        for query in ("first", "second", "first", "third"):
+            caching_engine.search(query)
+
+        assert [key[0] for key in caching_engine._query_cache] == ["first", "third"]
+
+    def test_missing_stats_row_disables_query_cache(self, caching_engine):
+        """Test that nothing is cached while the index version is unknown."""
+        with get_cursor() as cursor:
+            cursor.execute("DELETE FROM documents_stats")
+
+        caching_engine.search("aviation")
+        results, stats = caching_engine.search("aviation")
+
+        assert len(results) == 2
+        assert not stats.cache_hit
+        assert caching_engine.cache_info()["size"] == 0
+
+    def test_semantic_cache_cleared_on_index_change(self, caching_engine):
+        """Test that writing to the index invalidates cached results."""
+        caching_engine.search("aviation")
+
+        DocumentRepository().insert(
+            filepath="/test/nouveau.pdf",
+            filename="nouveau.pdf",
+            page_num=1,
+            content="Aviation générale"
+        )
+        _, stats = caching_engine.search("aviation")
+
+        assert not stats.cache_hit
+        assert caching_engine.vector_repo.search_similar.call_count == 2
+
 
 class TestSemanticEngineSnippet:
     """Tests for snippet generation."""
 
     @pytest.fixture
-    def engine_for_snippet(self, configured_db, reset_embedding_singleton):
+    def engine_for_snippet(self, schema_db, reset_embedding_singleton):
         """Create engine for snippet testing."""
-        init_schema()
-
-        with patch("src.search.semantic_engine.get_embedding_service"):
+        with patch(
+            "src.search.semantic_engine.get_embedding_service",
+            _make_fake_embed_service
+        ):
             engine = SemanticEngine()
 
         return engine
@@ -326,3 +543,9 @@ class TestSemanticEngineSnippet:
         if snippet.endswith("..."):
             before_dots = snippet[:-3]
             assert before_dots.endswith(" ") or before_dots.endswith("d")
+
+    def test_generate_snippet_keeps_content_within_suffix_length(self, engine_for_snippet):
+        """Test that content barely over snippet_length is not cut for the suffix."""
+        content = "x" * (engine_for_snippet.snippet_length + 3)
+
+        assert engine_for_snippet._generate_snippet(content) == content
@@ -5,9 +5,13 @@ Tests hashing, size calculation, path manipulation, and directory creation.
 All tests use temporary files/directories for safety.
 """
 
+import hashlib
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 from src.utils.file_utils import (
+    HASH_HEX_LEN,
     get_file_hash,
     get_file_size_mb,
     get_relative_path,
@@ -26,8 +30,9 @@ class TestGetFileHash:
         hash_value = get_file_hash(test_file)
 
         assert isinstance(hash_value, str)
-        assert len(hash_value) == 32  # MD5 hex length
-        assert all(c in "0123456789abcdef" for c in hash_value)
+        assert len(hash_value) == HASH_HEX_LEN
+        # Round-trip rejects uppercase, whitespace and odd lengths
+        assert bytes.fromhex(hash_value).hex() == hash_value
 
     def test_same_content_same_hash(self, temp_dir: Path):
         """Test that identical content produces identical hash."""
@@ -50,6 +55,13 @@ class TestGetFileHash:
 
         assert get_file_hash(file1) != get_file_hash(file2)
 
+    def test_hash_is_sha256_of_first_chunk(self, temp_dir: Path):
+        """Test that only the first chunk_size bytes are hashed with SHA-256."""
+        test_file = temp_dir / "test.bin"
+        test_file.write_bytes(b"a" * 100 + b"b" * 100)
+
+        assert get_file_hash(test_file, chunk_size=100) == hashlib.sha256(b"a" * 100).hexdigest()
+
     def test_hash_with_string_path(self, temp_dir: Path):
         """Test that hash works with string paths."""
         test_file = temp_dir / "test.txt"
@@ -64,7 +76,7 @@ class TestGetFileHash:
         hash_value = get_file_hash(sample_pdf)
 
         assert isinstance(hash_value, str)
-        assert len(hash_value) == 32
+        assert len(hash_value) == HASH_HEX_LEN
 
 
 class TestGetFileSizeMb:
@@ -121,6 +133,15 @@ class TestGetRelativePath:
         # Should return absolute path since not relative to base
         assert Path(rel_path).is_absolute() or ".." in rel_path
 
+    def test_sibling_with_common_prefix_is_outside(self, temp_dir: Path):
+        """Test that a sibling sharing the base name prefix is not treated as inside."""
+        base = temp_dir / "data"
+        sibling_file = temp_dir / "data_old" / "file.pdf"
+
+        rel_path = get_relative_path(sibling_file, base)
+
+        assert Path(rel_path).is_absolute()
+
     def test_relative_path_with_strings(self, temp_dir: Path):
         """Test that function works with string arguments."""
         test_file = temp_dir / "test.txt"
@@ -130,6 +151,34 @@ class TestGetRelativePath:
 
         assert rel_path == "test.txt"
 
+    def test_follows_retargeted_base_symlink(self, temp_dir: Path):
+        """Test that a base symlink is resolved again on every call."""
+        first = temp_dir / "first"
+        second = temp_dir / "second"
+        first.mkdir()
+        second.mkdir()
+        (second / "file.pdf").touch()
+
+        link = temp_dir / "data"
+        link.symlink_to(first, target_is_directory=True)
+        assert Path(get_relative_path(second / "file.pdf", link)).is_absolute()
+
+        link.unlink()
+        link.symlink_to(second, target_is_directory=True)
+        assert get_relative_path(second / "file.pdf", link) == "file.pdf"
+
+    def test_resolved_base_used_as_is(self, temp_dir: Path):
+        """Test that base_resolved=True skips resolving the base again."""
+        base = temp_dir.resolve()
+        test_file = base / "test.txt"
+        test_file.touch()
+
+        with patch("src.utils.file_utils.os.path.realpath", wraps=os.path.realpath) as spy:
+            rel_path = get_relative_path(test_file, str(base), base_resolved=True)
+
+        assert rel_path == "test.txt"
+        spy.assert_called_once_with(test_file)
+
 
 class TestEnsureDirectory:
     """Tests for ensure_directory function."""
@@ -22,6 +22,14 @@ class TestCleanText:
 
         assert result == "Hello world test"
 
+    def test_replaces_tabs_and_mixed_runs(self):
+        """Test that single tabs and mixed space/tab runs become one space."""
+        text = "a\tb \t c\t\td e"
+
+        result = clean_text(text)
+
+        assert result == "a b c d e"
+
     def test_removes_multiple_newlines(self):
         """Test that multiple newlines are reduced to double newline."""
         text = "Line 1\n\n\n\n\nLine 2"
@@ -61,6 +69,15 @@ class TestCleanText:
 
         assert "Café" in result or "Cafe" in result  # Depending on normalization
 
+    def test_removes_control_characters(self):
+        """Test that control and format characters are dropped, not tabs/newlines."""
+        # NUL and BEL (C0), CR, and a zero-width space (format category)
+        text = "a\x00b\x07c\u200bd\r\ne\tf"
+
+        result = clean_text(text)
+
+        assert result == "abcd\ne f"
+
 
 class TestTruncateText:
     """Tests for truncate_text function."""
@@ -200,3 +217,9 @@ class TestExtractKeywords:
 
         # Should have test at least once
         assert "test" in keywords
+
+    def test_keeps_numbers_meeting_min_length(self):
+        """Test that numeric tokens follow the same length filter."""
+        keywords = extract_keywords("règlement 2024 article 12", min_length=3)
+
+        assert keywords == ["règlement", "2024", "article"]